@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+# Opt-in native build of the CSV/config parsing hot path:
+#   pip install mypy && AI_INVESTOR_MYPYC=1 pip install --no-build-isolation .
+# Without the flag this is a plain pure-Python install driven by pyproject.toml.
+_MYPYC_MODULES = [
+    "src/ai_investor/collectors/sbi_csv.py",
+    "src/ai_investor/config.py",
+]
+
+ext_modules = []
+if os.getenv("AI_INVESTOR_MYPYC", "").strip() == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--ignore-missing-imports", *_MYPYC_MODULES])
+
+setup(ext_modules=ext_modules)
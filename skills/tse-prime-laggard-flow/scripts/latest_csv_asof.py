@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import os
 import re
 import sys
 from datetime import date, datetime
 from pathlib import Path
+from typing import Iterator
 
 DATE_PATTERNS = (
     re.compile(r"(20\d{2})(\d{2})(\d{2})"),
@@ -13,8 +16,7 @@ DATE_PATTERNS = (
 )
 
 
-def _extract_date_from_name(path: Path) -> date | None:
-    name = path.name
+def _extract_date_from_name(name: str) -> date | None:
     for pattern in DATE_PATTERNS:
         match = pattern.search(name)
         if not match:
@@ -27,31 +29,41 @@ def _extract_date_from_name(path: Path) -> date | None:
     return None
 
 
+def _walk_csv(root: str, pattern: str) -> Iterator[tuple[str, str, float]]:
+    """Yield (path, name, mtime) for CSV files under root, reusing scandir metadata."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_csv(entry.path, pattern)
+        elif fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file():
+            yield entry.path, entry.name, entry.stat().st_mtime
+
+
 def resolve_as_of(data_dir: Path) -> tuple[date, Path]:
-    csv_files = sorted(p for p in data_dir.rglob("*.csv") if p.is_file())
+    csv_files = list(_walk_csv(str(data_dir), "*.csv"))
     if not csv_files:
         raise FileNotFoundError(f"No CSV files found under: {data_dir}")
 
-    dated_files: list[tuple[date, float, Path]] = []
-    undated_files: list[tuple[float, Path]] = []
+    dated_files: list[tuple[date, float, str]] = []
+    undated_files: list[tuple[float, str]] = []
 
-    for csv_path in csv_files:
-        stat = csv_path.stat()
-        name_date = _extract_date_from_name(csv_path)
+    for csv_path, name, mtime in csv_files:
+        name_date = _extract_date_from_name(name)
         if name_date is not None:
-            dated_files.append((name_date, stat.st_mtime, csv_path))
+            dated_files.append((name_date, mtime, csv_path))
         else:
-            undated_files.append((stat.st_mtime, csv_path))
+            undated_files.append((mtime, csv_path))
 
     if dated_files:
-        dated_files.sort(key=lambda x: (x[0], x[1], x[2].as_posix()))
-        best = dated_files[-1]
-        return best[0], best[2]
+        best = max(dated_files)
+        return best[0], Path(best[2])
 
-    undated_files.sort(key=lambda x: (x[0], x[1].as_posix()))
-    latest = undated_files[-1]
+    latest = max(undated_files)
     as_of = datetime.fromtimestamp(latest[0]).date()
-    return as_of, latest[1]
+    return as_of, Path(latest[1])
 
 
 def main() -> int:
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    from orjson import loads as _json_loads
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _json_loads = json.loads  # type: ignore[assignment]
+
+LOGGER = logging.getLogger(__name__)
+
+
+def disk_cache_path(name: str, *, disable_env: str | None = None) -> Path | None:
+    """Return the cache file path for name, or None when disk caching is disabled."""
+    if os.getenv("AI_INVESTOR_DISABLE_CACHE", "0") == "1":
+        return None
+    if disable_env and os.getenv(disable_env, "0") == "1":
+        return None
+    cache_dir = os.getenv("AI_INVESTOR_CACHE_DIR", "").strip()
+    base_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "ai_investor"
+    return base_dir / name
+
+
+def read_disk_cache(path: Path | None) -> dict[str, Any]:
+    if path is None or not path.is_file():
+        return {}
+    try:
+        loaded = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        LOGGER.warning("Ignoring unreadable cache file: %s", path)
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def write_disk_cache(path: Path | None, payload: dict[str, Any]) -> None:
+    # Write to a sibling temp file and rename so readers never see a partial file.
+    if path is None:
+        return
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(_json_dumps(payload))
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        LOGGER.warning("Could not write cache file %s: %s", path, exc)
+
+
+def _json_dumps(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
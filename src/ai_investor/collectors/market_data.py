@@ -1,18 +1,70 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date, timedelta
+import json
 import logging
 import os
+import re
 import time
-from typing import Any
+from typing import Any, Iterator, Sequence
 
 import requests
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
+from ai_investor.cache import disk_cache_path, read_disk_cache, write_disk_cache
 from ai_investor.config import DataSource, UniverseConfig
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_BASE_URL = "https://api.jquants.com/v2"
+_LISTED_INFO_PATH = "/equities/master"
+_DAILY_QUOTES_PATH = "/equities/bars/daily"
+_FIN_SUMMARY_PATH = "/fins/summary"
+
+_PRIME_MARKET_CODES = frozenset({"0111"})
+# Case-insensitive single-pass match for "prime" / "プライム" in market names and segments.
+_PRIME_NAME_RE = re.compile("prime|プライム", re.IGNORECASE)
+_TURNOVER_KEYS = ("Va", "TurnoverValue", "turnover_value")
+# J-Quants can still publish quotes and statements for a date a business day or two later,
+# so per-as_of disk caches are only read and written once the date has settled.
+_CACHE_SETTLE_BUSINESS_DAYS = 2
+_CLOSE_KEYS = ("AdjC", "C", "AdjustmentClose", "Close", "adjustment_close", "close")
+
+# Statement field aliases in priority order (V2 short names first, then V1 / snake_case names).
+_STATEMENT_FIELDS: dict[str, tuple[str, ...]] = {
+    "book_value_per_share": ("BPS", "BookValuePerShare", "book_value_per_share"),
+    "eps": ("EPS", "EarningsPerShare", "eps"),
+    "equity_ratio": ("EqAR", "EquityToAssetRatio", "equity_ratio"),
+    "operating_cash_flow": ("CFO", "CashFlowsFromOperatingActivities", "cash_flows_from_operating_activities"),
+    "net_sales": ("Sales", "NetSales", "Revenue", "net_sales", "revenue"),
+    "operating_profit": ("OP", "OperatingProfit", "OperatingIncome", "operating_profit", "operating_income"),
+    "profit": ("NP", "Profit", "NetIncome", "profit", "net_income"),
+    "equity": ("Eq", "Equity", "equity"),
+    "shares_outstanding": (
+        "ShOutFY",
+        "NumberOfIssuedAndOutstandingSharesAtTheEndOfFiscalYearIncludingTreasuryStock",
+        "NumberOfIssuedAndOutstandingSharesAtTheEndOfQuarterIncludingTreasuryStock",
+        "IssuedShares",
+    ),
+    "dividend_annual": (
+        "ForecastDividendPerShareAnnual",
+        "ResultDividendPerShareAnnual",
+        "FDivAnn",
+        "DivAnn",
+        "forecast_dividend_per_share_annual",
+        "result_dividend_per_share_annual",
+    ),
+}
+_STATEMENT_ALIASES: dict[str, tuple[str, int]] = {
+    alias: (field_name, rank)
+    for field_name, aliases in _STATEMENT_FIELDS.items()
+    for rank, alias in enumerate(aliases)
+}
 
 
 @dataclass(slots=True)
@@ -44,14 +96,25 @@ class JQuantsApiClient:
         self.base_url = base_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
         self.session = requests.Session()
+        # Statement fetches fan out over worker threads that share this session.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._api_key = api_key or os.getenv("JQUANTS_API_KEY")
+        self._auth_headers: dict[str, str] | None = None
+        self._urls = {
+            path: f"{self.base_url}{path}" for path in (_LISTED_INFO_PATH, _DAILY_QUOTES_PATH, _FIN_SUMMARY_PATH)
+        }
         self.max_retries = int(os.getenv("JQUANTS_MAX_RETRIES", "3"))
 
     def get_listed_info(self, target_date: date | None = None) -> list[dict[str, Any]]:
+        return list(self.iter_listed_info(target_date=target_date))
+
+    def iter_listed_info(self, target_date: date | None = None) -> Iterator[dict[str, Any]]:
         params: dict[str, str] = {}
         if target_date:
             params["date"] = target_date.isoformat()
-        return self._get_paginated(path="/equities/master", params=params)
+        return self._get_paginated_iter(path=_LISTED_INFO_PATH, params=params)
 
     def get_daily_quotes(
         self,
@@ -61,6 +124,18 @@ class JQuantsApiClient:
         from_date: date | None = None,
         to_date: date | None = None,
     ) -> list[dict[str, Any]]:
+        return list(
+            self.iter_daily_quotes(target_date=target_date, code=code, from_date=from_date, to_date=to_date)
+        )
+
+    def iter_daily_quotes(
+        self,
+        *,
+        target_date: date | None = None,
+        code: str | None = None,
+        from_date: date | None = None,
+        to_date: date | None = None,
+    ) -> Iterator[dict[str, Any]]:
         params: dict[str, str] = {}
         if target_date:
             params["date"] = target_date.isoformat()
@@ -70,11 +145,11 @@ class JQuantsApiClient:
             params["from"] = from_date.isoformat()
         if to_date:
             params["to"] = to_date.isoformat()
-        return self._get_paginated(path="/equities/bars/daily", params=params)
+        return self._get_paginated_iter(path=_DAILY_QUOTES_PATH, params=params)
 
     def get_financial_summaries(self, code: str) -> list[dict[str, Any]]:
         params = {"code": code}
-        return self._get_paginated(path="/fins/summary", params=params)
+        return self._get_paginated(path=_FIN_SUMMARY_PATH, params=params)
 
     def _get_paginated(
         self,
@@ -82,23 +157,33 @@ class JQuantsApiClient:
         path: str,
         params: dict[str, str] | None = None,
     ) -> list[dict[str, Any]]:
-        merged: list[dict[str, Any]] = []
-        cursor: str | None = None
-        base_params = dict(params or {})
-
-        for _ in range(500):
-            call_params = dict(base_params)
-            if cursor:
-                call_params["pagination_key"] = cursor
-            payload = self._request("GET", path, params=call_params, authorized=True)
-            items = payload.get("data", [])
-            if isinstance(items, list):
-                merged.extend(items)
-            cursor = payload.get("pagination_key")
-            if not cursor:
-                break
+        return list(self._get_paginated_iter(path=path, params=params))
 
-        return merged
+    def _get_paginated_iter(
+        self,
+        *,
+        path: str,
+        params: dict[str, str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        # One params dict per pagination run; the cursor is overwritten in place, which is safe
+        # because it only changes after the previous request has completed.
+        call_params = dict(params) if params else {}
+
+        # Pages are cursor-chained, so at most one request can be in flight. Issue the next
+        # page as soon as its cursor is known and yield the current page while it is pending.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._request, "GET", path, params=call_params, authorized=True)
+            for page in range(500):
+                payload = pending.result()
+                cursor = payload.get("pagination_key")
+                if cursor and page < 499:
+                    call_params["pagination_key"] = cursor
+                    pending = executor.submit(self._request, "GET", path, params=call_params, authorized=True)
+                items = payload.get("data", [])
+                if isinstance(items, list):
+                    yield from items
+                if not cursor:
+                    break
 
     def _request(
         self,
@@ -109,11 +194,8 @@ class JQuantsApiClient:
         json_body: dict[str, Any] | None = None,
         authorized: bool,
     ) -> dict[str, Any]:
-        headers: dict[str, str] = {}
-        if authorized:
-            headers["x-api-key"] = self._ensure_api_key()
-
-        url = f"{self.base_url}{path}"
+        headers = self._ensure_auth_headers() if authorized else None
+        url = self._urls.get(path) or f"{self.base_url}{path}"
         response: requests.Response | None = None
         for attempt in range(self.max_retries + 1):
             try:
@@ -145,7 +227,7 @@ class JQuantsApiClient:
 
         payload: dict[str, Any]
         try:
-            payload = response.json()
+            payload = _json_loads(response.content)
         except ValueError:
             payload = {}
 
@@ -160,6 +242,12 @@ class JQuantsApiClient:
             raise JQuantsApiError("J-Quants API key is missing. Set JQUANTS_API_KEY.")
         return self._api_key
 
+    def _ensure_auth_headers(self) -> dict[str, str]:
+        # requests copies per-call headers, so the cached dict is never mutated.
+        if self._auth_headers is None:
+            self._auth_headers = {"x-api-key": self._ensure_api_key()}
+        return self._auth_headers
+
 
 class JQuantsMarketDataCollector:
     """Market/fundamental collector backed by J-Quants API."""
@@ -178,22 +266,26 @@ class JQuantsMarketDataCollector:
         self.client = client or JQuantsApiClient()
         self._price_snapshot_cache: dict[str, _PriceSnapshot] = {}
         self._price_snapshot_cache_as_of: date | None = None
+        # None marks tickers that returned no statements, so they are not re-requested.
+        self._statement_cache: dict[str, dict[str, Any] | None] = {}
+        self._statement_cache_as_of: date | None = None
 
     def fetch_universe(self) -> list[UniverseRow]:
-        listed_rows = self.client.get_listed_info(target_date=self.as_of)
         prime_rows: list[UniverseRow] = []
-        for row in listed_rows:
+        for row in self.client.iter_listed_info(target_date=self.as_of):
             if not self._is_target_market(row):
                 continue
-            code = str(row.get("Code", "")).strip()
+            # str() keeps numeric codes (e.g. Code as a JSON number) working; `or ""` covers missing/null values.
+            code = str(row.get("Code") or "").strip()
             if not code:
                 continue
-            company_name = str(row.get("CoName", "")).strip() or str(row.get("CompanyName", "")).strip() or code
+            company_name = str(row.get("CoName") or "").strip() or str(row.get("CompanyName") or "").strip() or code
             sector = (
-                str(row.get("S33Nm", "")).strip()
-                or str(row.get("Sector33CodeName", "")).strip()
-                or str(row.get("S33", "UNKNOWN")).strip()
-                or str(row.get("Sector33Code", "UNKNOWN")).strip()
+                str(row.get("S33Nm") or "").strip()
+                or str(row.get("Sector33CodeName") or "").strip()
+                or str(row.get("S33") or "").strip()
+                or str(row.get("Sector33Code") or "").strip()
+                or "UNKNOWN"
             )
             prime_rows.append(UniverseRow(ticker=code, company_name=company_name, sector=sector))
 
@@ -228,6 +320,11 @@ class JQuantsMarketDataCollector:
     def _apply_liquidity_filter(self, rows: list[UniverseRow]) -> list[UniverseRow]:
         if not rows:
             return []
+        # Decide up front whether the (slow) statement-based market-cap stage runs at all.
+        enforce_market_cap = os.getenv("JQUANTS_ENFORCE_MARKET_CAP", "0") == "1"
+        min_market_cap = self.universe_config.min_market_cap_jpy
+        check_market_cap = enforce_market_cap and min_market_cap > 0
+
         min_turnover = self.universe_config.min_avg_trading_value_20d_jpy
         snapshots = self._build_price_snapshot({row.ticker for row in rows})
         liquidity_filtered: list[UniverseRow] = []
@@ -239,9 +336,7 @@ class JQuantsMarketDataCollector:
                 continue
             liquidity_filtered.append(row)
 
-        enforce_market_cap = os.getenv("JQUANTS_ENFORCE_MARKET_CAP", "0") == "1"
-        min_market_cap = self.universe_config.min_market_cap_jpy
-        if min_market_cap <= 0 or not enforce_market_cap:
+        if not check_market_cap or not liquidity_filtered:
             return liquidity_filtered
 
         statements = self._fetch_latest_statements([row.ticker for row in liquidity_filtered])
@@ -281,51 +376,85 @@ class JQuantsMarketDataCollector:
         if not target_codes:
             return {}
 
-        if (
-            self._price_snapshot_cache_as_of == self.as_of
-            and all(code in self._price_snapshot_cache for code in target_codes)
-        ):
-            return {code: self._price_snapshot_cache[code] for code in target_codes}
-
-        turnover_sum = {code: 0.0 for code in target_codes}
-        trading_days_count = {code: 0 for code in target_codes}
-        latest_close: dict[str, float] = {}
         target_trading_days = int(os.getenv("JQUANTS_LIQUIDITY_LOOKBACK_DAYS", "5"))
         target_trading_days = max(1, target_trading_days)
+        cache_path = (
+            disk_cache_path(
+                f"price_snapshot_{self.as_of.isoformat()}_{target_trading_days}d.json",
+                disable_env="JQUANTS_DISABLE_CACHE",
+            )
+            if _is_settled(self.as_of)
+            else None
+        )
+        if self._price_snapshot_cache_as_of != self.as_of:
+            # Entries missing a close or turnover are refetched rather than trusted from disk.
+            self._price_snapshot_cache = {
+                code: _PriceSnapshot(close=values[0], avg_turnover_20d=values[1])
+                for code, values in read_disk_cache(cache_path).items()
+                if isinstance(values, list) and len(values) == 2 and None not in values
+            }
+            self._price_snapshot_cache_as_of = self.as_of
+
+        missing = target_codes - self._price_snapshot_cache.keys()
+        if not missing:
+            return {code: self._price_snapshot_cache[code] for code in target_codes}
+
         max_calendar_days = max(15, target_trading_days * 4)
+        days = [self.as_of - timedelta(days=offset) for offset in range(max_calendar_days)]
+        max_workers = max(1, int(os.getenv("JQUANTS_QUOTES_CONCURRENCY", "4")))
 
-        for offset in range(0, max_calendar_days):
-            day = self.as_of - timedelta(days=offset)
-            daily_quotes = self.client.get_daily_quotes(target_date=day)
-            if not daily_quotes:
-                continue
-            for quote in daily_quotes:
-                code = str(quote.get("Code", "")).strip()
-                if code not in target_codes:
-                    continue
-
-                turnover = _first_float(quote, ["Va", "TurnoverValue", "turnover_value"])
-                if turnover is not None and trading_days_count[code] < target_trading_days:
-                    turnover_sum[code] += turnover
-                    trading_days_count[code] += 1
-
-                if code not in latest_close:
-                    close = _first_float(quote, ["AdjC", "C", "AdjustmentClose", "Close", "adjustment_close", "close"])
-                    if close is not None:
-                        latest_close[code] = close
-
-            if all(trading_days_count[code] >= target_trading_days for code in target_codes):
-                break
+        turnover_sum = {code: 0.0 for code in missing}
+        trading_days_count = {code: 0 for code in missing}
+        latest_close: dict[str, float] = {}
+        remaining = len(missing)
+
+        # The daily quotes endpoint only accepts from/to together with a code, so a market-wide
+        # window is fetched one date at a time. Dates are requested in waves of max_workers and
+        # applied newest first, stopping once every code has target_trading_days of turnover.
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(days))) as executor:
+            for start in range(0, len(days), max_workers):
+                wave = days[start : start + max_workers]
+                for daily_quotes in executor.map(lambda day: self.client.get_daily_quotes(target_date=day), wave):
+                    for quote in daily_quotes:
+                        code = str(quote.get("Code", "")).strip()
+                        count = trading_days_count.get(code)
+                        if count is None:
+                            continue
+
+                        turnover = _first_float(quote, _TURNOVER_KEYS)
+                        if turnover is not None and count < target_trading_days:
+                            turnover_sum[code] += turnover
+                            trading_days_count[code] = count + 1
+                            if count + 1 == target_trading_days:
+                                remaining -= 1
+
+                        if code not in latest_close:
+                            close = _first_float(quote, _CLOSE_KEYS)
+                            if close is not None:
+                                latest_close[code] = close
+                    if not remaining:
+                        break
+                if not remaining:
+                    break
 
         snapshot: dict[str, _PriceSnapshot] = {}
-        for code in target_codes:
+        for code in missing:
             count = trading_days_count[code]
-            avg_turnover = (turnover_sum[code] / count) if count > 0 else None
-            snapshot[code] = _PriceSnapshot(close=latest_close.get(code), avg_turnover_20d=avg_turnover)
+            snapshot[code] = _PriceSnapshot(
+                close=latest_close.get(code),
+                avg_turnover_20d=(turnover_sum[code] / count) if count > 0 else None,
+            )
 
-        self._price_snapshot_cache_as_of = self.as_of
         self._price_snapshot_cache.update(snapshot)
-        return snapshot
+        write_disk_cache(
+            cache_path,
+            {
+                code: [row.close, row.avg_turnover_20d]
+                for code, row in self._price_snapshot_cache.items()
+                if row.close is not None and row.avg_turnover_20d is not None
+            },
+        )
+        return {code: self._price_snapshot_cache[code] for code in target_codes}
 
     def _fetch_latest_statements(self, tickers: list[str]) -> dict[str, dict[str, Any]]:
         max_codes = int(os.getenv("JQUANTS_MAX_STATEMENT_CODES", "300"))
@@ -337,23 +466,42 @@ class JQuantsMarketDataCollector:
                 max_codes,
             )
 
+        as_of_iso = self.as_of.isoformat()
+        cache_path = (
+            disk_cache_path(f"statements_{as_of_iso}.json", disable_env="JQUANTS_DISABLE_CACHE")
+            if _is_settled(self.as_of)
+            else None
+        )
+        if self._statement_cache_as_of != self.as_of:
+            # Files from older versions may hold empty entries or statements disclosed after as_of.
+            self._statement_cache = {
+                ticker: statement
+                for ticker, statement in read_disk_cache(cache_path).items()
+                if isinstance(statement, dict) and _disclosed_by(statement, as_of_iso)
+            }
+            self._statement_cache_as_of = self.as_of
+
+        missing = [ticker for ticker in selected if ticker not in self._statement_cache]
+        if missing:
+            max_workers = max(1, int(os.getenv("JQUANTS_STMT_CONCURRENCY", "8")))
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                futures = {
+                    executor.submit(self.client.get_financial_summaries, code=ticker): ticker for ticker in missing
+                }
+                for future in as_completed(futures):
+                    summaries = [row for row in future.result() if _disclosed_by(row, as_of_iso)]
+                    self._statement_cache[futures[future]] = _latest_statement(summaries) if summaries else None
+            # None entries only suppress repeat requests within this process; they are never persisted.
+            write_disk_cache(
+                cache_path,
+                {ticker: statement for ticker, statement in self._statement_cache.items() if statement},
+            )
+
         statement_map: dict[str, dict[str, Any]] = {}
         for ticker in selected:
-            summaries = self.client.get_financial_summaries(code=ticker)
-            if not summaries:
-                continue
-            statement_map[ticker] = max(
-                summaries,
-                key=lambda row: (
-                    str(row.get("Date", "")),
-                    str(row.get("DiscDate", "")),
-                    str(row.get("DiscTime", "")),
-                    str(row.get("DiscNo", "")),
-                    str(row.get("DisclosedDate", "")),
-                    str(row.get("DisclosedTime", "")),
-                    str(row.get("DisclosureNumber", "")),
-                ),
-            )
+            statement = self._statement_cache.get(ticker)
+            if statement:
+                statement_map[ticker] = statement
         return statement_map
 
     def _merge_statement_metrics(
@@ -362,40 +510,17 @@ class JQuantsMarketDataCollector:
         statement: dict[str, Any],
         close_price: float | None,
     ) -> None:
-        book_value_per_share = _first_float(statement, ["BPS", "BookValuePerShare", "book_value_per_share"])
-        eps = _first_float(statement, ["EPS", "EarningsPerShare", "eps"])
-        equity_ratio = _first_float(statement, ["EqAR", "EquityToAssetRatio", "equity_ratio"])
-        cash_flow_from_ops = _first_float(
-            statement,
-            ["CFO", "CashFlowsFromOperatingActivities", "cash_flows_from_operating_activities"],
-        )
-        net_sales = _first_float(statement, ["Sales", "NetSales", "Revenue", "net_sales", "revenue"])
-        operating_profit = _first_float(
-            statement,
-            ["OP", "OperatingProfit", "OperatingIncome", "operating_profit", "operating_income"],
-        )
-        profit = _first_float(statement, ["NP", "Profit", "NetIncome", "profit", "net_income"])
-        equity = _first_float(statement, ["Eq", "Equity", "equity"])
-        shares_outstanding = _first_float(
-            statement,
-            [
-                "ShOutFY",
-                "NumberOfIssuedAndOutstandingSharesAtTheEndOfFiscalYearIncludingTreasuryStock",
-                "NumberOfIssuedAndOutstandingSharesAtTheEndOfQuarterIncludingTreasuryStock",
-                "IssuedShares",
-            ],
-        )
-        dividend_annual = _first_float(
-            statement,
-            [
-                "ForecastDividendPerShareAnnual",
-                "ResultDividendPerShareAnnual",
-                "FDivAnn",
-                "DivAnn",
-                "forecast_dividend_per_share_annual",
-                "result_dividend_per_share_annual",
-            ],
-        )
+        parsed = _parse_statement(statement)
+        book_value_per_share = parsed.get("book_value_per_share")
+        eps = parsed.get("eps")
+        equity_ratio = parsed.get("equity_ratio")
+        cash_flow_from_ops = parsed.get("operating_cash_flow")
+        net_sales = parsed.get("net_sales")
+        operating_profit = parsed.get("operating_profit")
+        profit = parsed.get("profit")
+        equity = parsed.get("equity")
+        shares_outstanding = parsed.get("shares_outstanding")
+        dividend_annual = parsed.get("dividend_annual")
 
         if equity_ratio is not None:
             metrics["equity_ratio"] = equity_ratio
@@ -427,29 +552,85 @@ class JQuantsMarketDataCollector:
         if self.universe_config.market != "TSE_PRIME":
             return True
 
-        market_code = str(row.get("Mkt", "")).strip() or str(row.get("MarketCode", "")).strip()
-        market_name = str(row.get("MktNm", "")).strip().lower() or str(row.get("MarketCodeName", "")).strip().lower()
-        market_segment = str(row.get("MarketSegment", "")).strip().lower()
-
-        if market_code == "0111":
-            return True
-        if "prime" in market_name or "プライム" in market_name:
+        market_code = str(row.get("Mkt") or "").strip() or str(row.get("MarketCode") or "").strip()
+        if market_code in _PRIME_MARKET_CODES:
             return True
-        if "prime" in market_segment or "プライム" in market_segment:
+        market_name = str(row.get("MktNm") or "").strip() or str(row.get("MarketCodeName") or "").strip()
+        if _PRIME_NAME_RE.search(market_name):
             return True
-        return False
+        return _PRIME_NAME_RE.search(str(row.get("MarketSegment") or "")) is not None
+
+
+def _is_settled(as_of: date) -> bool:
+    cutoff = date.today()
+    business_days = 0
+    while business_days < _CACHE_SETTLE_BUSINESS_DAYS:
+        cutoff -= timedelta(days=1)
+        if cutoff.weekday() < 5:
+            business_days += 1
+    return as_of <= cutoff
+
+
+def _disclosed_by(statement: dict[str, Any], as_of_iso: str) -> bool:
+    # Rows without a disclosure date cannot be placed in time and are kept.
+    disclosed = statement.get("DiscDate") or statement.get("DisclosedDate")
+    if not disclosed:
+        return True
+    return str(disclosed)[:10] <= as_of_iso
+
+
+def _latest_statement(summaries: list[dict[str, Any]]) -> dict[str, Any]:
+    best_row = summaries[0]
+    best_key: tuple[str, ...] | None = None
+    for row in summaries:
+        # Every field compares in its str() form, so mixed None/int/str values never raise.
+        key = (
+            str(row.get("Date") or ""),
+            str(row.get("DiscDate") or ""),
+            str(row.get("DiscTime") or ""),
+            str(row.get("DiscNo") or ""),
+            str(row.get("DisclosedDate") or ""),
+            str(row.get("DisclosedTime") or ""),
+            str(row.get("DisclosureNumber") or ""),
+        )
+        if best_key is None or key > best_key:
+            best_key = key
+            best_row = row
+    return best_row
+
+
+def _parse_statement(statement: dict[str, Any]) -> dict[str, float]:
+    """Resolve statement aliases in one pass, keeping the highest-priority parsable alias."""
+    resolved: dict[str, tuple[int, float]] = {}
+    for key, raw_value in statement.items():
+        alias = _STATEMENT_ALIASES.get(key)
+        if alias is None:
+            continue
+        field_name, rank = alias
+        current = resolved.get(field_name)
+        if current is not None and current[0] <= rank:
+            continue
+        value = _to_float(raw_value)
+        if value is not None:
+            resolved[field_name] = (rank, value)
+    return {field_name: value for field_name, (_, value) in resolved.items()}
 
 
 def _to_float(value: Any) -> float | None:
-    if value in (None, ""):
+    # JSON numbers arrive as int/float, so dispatch on type before paying for try/except.
+    if value is None or value == "":
         return None
-    try:
+    if isinstance(value, (int, float)):
         return float(value)
-    except (TypeError, ValueError):
-        return None
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
 
 
-def _first_float(row: dict[str, Any], keys: list[str]) -> float | None:
+def _first_float(row: dict[str, Any], keys: Sequence[str]) -> float | None:
     for key in keys:
         value = _to_float(row.get(key))
         if value is not None:
@@ -6,10 +6,15 @@ from email.utils import parsedate_to_datetime
 from html import unescape
 import os
 import re
+import threading
 from xml.etree import ElementTree
 
 import requests
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r'https?://[^\s"<>]+')
+_WS_RE = re.compile(r"\s+")
+
 
 @dataclass(slots=True)
 class NewsItem:
@@ -39,6 +44,13 @@ class WebSearchNewsCollector:
             "WEB_NEWS_USER_AGENT",
             "ai-investor/0.1 (public-rss-news-collector)",
         ).strip()
+        # Built once per collector: one pooled connection and fixed headers shared by every query.
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = self.user_agent
+        # Deep dives call fetch_news from several threads; cap simultaneous requests to the feed.
+        self._request_slots = threading.BoundedSemaphore(
+            _read_int_env("WEB_NEWS_MAX_CONCURRENCY", default=4, minimum=1, maximum=16)
+        )
 
     def fetch_news(self, query: str, lookback_days: int, as_of: date | None = None) -> list[NewsItem]:
         end_dt = datetime.now(timezone.utc) if as_of is None else datetime.combine(as_of, time.max, tzinfo=timezone.utc)
@@ -50,16 +62,16 @@ class WebSearchNewsCollector:
             "gl": "JP",
             "ceid": "JP:ja",
         }
-        headers = {"User-Agent": self.user_agent}
-
         try:
-            response = requests.get(self.base_url, params=params, headers=headers, timeout=self.timeout)
+            with self._request_slots:
+                response = self.session.get(self.base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
             root = ElementTree.fromstring(response.content)
         except (requests.RequestException, ElementTree.ParseError):
             return []
 
         items: list[NewsItem] = []
+        seen_urls: set[str] = set()
         for node in root.findall("./channel/item"):
             title = _clean_text(_xml_text(node, "title"))
             link = _clean_text(_xml_text(node, "link"))
@@ -76,6 +88,9 @@ class WebSearchNewsCollector:
             if candidate_url and "news.google.com" not in candidate_url:
                 link = candidate_url
 
+            if link in seen_urls:
+                continue
+
             pub_text = _clean_text(_xml_text(node, "pubDate"))
             published_dt = _parse_rss_datetime(pub_text)
             if published_dt is not None:
@@ -87,6 +102,7 @@ class WebSearchNewsCollector:
             else:
                 published_at = pub_text
 
+            seen_urls.add(link)
             items.append(
                 NewsItem(
                     source=source_name,
@@ -100,7 +116,7 @@ class WebSearchNewsCollector:
             if len(items) >= self.max_items:
                 break
 
-        return _dedupe_by_url(items)
+        return items
 
 
 def _xml_text(node: ElementTree.Element, tag: str) -> str:
@@ -125,32 +141,23 @@ def _parse_rss_datetime(value: str) -> datetime | None:
 def _strip_html(text: str) -> str:
     if not text:
         return ""
-    no_tags = re.sub(r"<[^>]+>", " ", text)
-    return unescape(no_tags)
+    if "<" in text:
+        text = _TAG_RE.sub(" ", text)
+    return unescape(text) if "&" in text else text
 
 
 def _extract_first_url(text: str) -> str:
     if not text:
         return ""
-    match = re.search(r'https?://[^\s"<>]+', text)
+    match = _URL_RE.search(text)
     if not match:
         return ""
-    return unescape(match.group(0))
+    url = match.group(0)
+    return unescape(url) if "&" in url else url
 
 
 def _clean_text(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "").strip())
-
-
-def _dedupe_by_url(items: list[NewsItem]) -> list[NewsItem]:
-    deduped: list[NewsItem] = []
-    seen_urls: set[str] = set()
-    for item in items:
-        if not item.url or item.url in seen_urls:
-            continue
-        seen_urls.add(item.url)
-        deduped.append(item)
-    return deduped
+    return _WS_RE.sub(" ", (text or "").strip())
 
 
 def _read_int_env(name: str, *, default: int, minimum: int, maximum: int) -> int:
@@ -1,14 +1,44 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from ai_investor.cache import disk_cache_path, read_disk_cache, write_disk_cache
 from ai_investor.config import DataSource, UniverseConfig
 from ai_investor.collectors.market_data import UniverseRow
 
 
+# Bump when the parsed record layout changes so stale disk caches are ignored.
+_RECORDS_CACHE_VERSION = 2
+
+_PRIME_MARKET_TOKENS = ("東証P", "東P", "プライム", "Prime")
+_NULL_TOKENS = frozenset({"-", "--", "---", "N/A", "n/a"})
+# Drops thousands separators and percent signs in a single pass.
+_DROP_CHARS = str.maketrans("", "", ",%")
+
+# metric key -> (SBI columns in priority order, unit multiplier to JPY / plain value)
+_METRIC_COLUMNS: tuple[tuple[str, tuple[str, ...], int], ...] = (
+    ("latest_close", ("現在値",), 1),
+    ("per", ("PER(株価収益率)(予)(倍)", "PER(株価収益率)(倍)"), 1),
+    ("pbr", ("PBR(株価純資産倍率)(倍)",), 1),
+    ("dividend_yield", ("配当利回り(%)",), 1),
+    ("roe", ("ROE(自己資本利益率)(%)", "ROE(%)"), 1),
+    ("equity_ratio", ("自己資本比率(%)",), 1),
+    ("net_de_ratio", ("有利子負債自己資本比率(%)",), 1),
+    ("operating_margin", ("売上高営業利益率(%)",), 1),
+    ("revenue_growth_forecast", ("売上高成長率(予)(%)", "売上高変化率(%)"), 1),
+    ("op_income_growth_forecast", ("経常利益成長率(予)(%)", "経常利益変化率(%)"), 1),
+    ("revenue_cagr_3y", ("過去3年平均売上高成長率(予)(%)", "売上高変化率(%)"), 1),
+    ("op_income_cagr_3y", ("過去3年平均経常利益成長率(予)(%)", "経常利益変化率(%)"), 1),
+    ("market_cap_jpy", ("時価総額(百万円)",), 1_000_000),
+    ("avg_turnover_20d", ("平均売買代金(千円)",), 1_000),
+)
+
+
 @dataclass(slots=True)
 class _SbiRecord:
     ticker: str
@@ -24,87 +54,111 @@ class SbiCsvMarketDataCollector:
         self.data_source = data_source
         self.universe_config = universe_config
         self._records_cache: list[_SbiRecord] | None = None
+        self._records_by_ticker: dict[str, _SbiRecord] = {}
 
     def fetch_universe(self) -> list[UniverseRow]:
-        records = self._load_records()
-        rows = [
+        # Records are already filtered by market and liquidity while parsing.
+        return [
             UniverseRow(ticker=r.ticker, company_name=r.company_name, sector=r.market)
-            for r in records
-            if self._passes_market(r) and self._passes_liquidity(r)
+            for r in self._load_records()
         ]
-        return rows
 
     def fetch_quant_metrics(self, tickers: list[str]) -> dict[str, dict[str, float]]:
-        selected = set(tickers)
-        metrics_map: dict[str, dict[str, float]] = {}
-        for record in self._load_records():
-            if record.ticker in selected:
-                metrics_map[record.ticker] = dict(record.metrics)
-        return metrics_map
+        self._load_records()
+        by_ticker = self._records_by_ticker
+        # Metrics dicts are shared with the record cache; downstream scoring and reporting only read them.
+        return {ticker: by_ticker[ticker].metrics for ticker in tickers if ticker in by_ticker}
 
     def _load_records(self) -> list[_SbiRecord]:
         if self._records_cache is not None:
             return self._records_cache
 
         csv_path = self._resolve_csv_path()
+        stat = csv_path.stat()
+        # Only universe survivors are cached, so the filter settings are part of the key.
+        cache_key = "|".join(
+            [
+                str(csv_path.resolve()),
+                self.universe_config.market,
+                str(self.universe_config.min_avg_trading_value_20d_jpy),
+                str(self.universe_config.min_market_cap_jpy),
+            ]
+        )
+        cache_path = disk_cache_path(f"sbi_records_{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()[:16]}.json")
+        cached = read_disk_cache(cache_path)
+        if (
+            cached.get("version") == _RECORDS_CACHE_VERSION
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and cached.get("size") == stat.st_size
+        ):
+            return self._store_records(
+                [
+                    _SbiRecord(ticker=ticker, company_name=company_name, market=market, metrics=metrics)
+                    for ticker, company_name, market, metrics in cached.get("records", [])
+                ]
+            )
+
         rows: list[_SbiRecord] = []
-        with csv_path.open("r", encoding="utf-8-sig", newline="") as fh:
-            reader = csv.DictReader(fh)
+        # SBI exports are small: read and decode the whole file in one call instead of
+        # streaming it through TextIOWrapper's incremental decoder.
+        text = csv_path.read_bytes().decode("utf-8-sig")
+        with io.StringIO(text, newline="") as fh:
+            reader = csv.reader(fh)
+            header = next(reader, [])
+            # Resolve column positions once from the header instead of building a dict per row.
+            column_index = {name: i for i, name in enumerate(header)}
+            ticker_i = column_index.get("コード")
+            name_i = column_index.get("銘柄名")
+            market_i = column_index.get("市場")
+            metric_indices = tuple(
+                (key, tuple(column_index[name] for name in column_names if name in column_index), scale)
+                for key, column_names, scale in _METRIC_COLUMNS
+            )
+            # The 市場 column holds only a handful of distinct values, so the token scan in
+            # _passes_market runs once per distinct market instead of once per row.
+            market_verdicts: dict[str, bool] = {}
             for row in reader:
                 if not row:
                     continue
-                ticker = str(row.get("コード", "")).strip()
+                ticker = _cell(row, ticker_i).strip()
                 if not ticker:
                     continue
 
-                company_name = str(row.get("銘柄名", "")).strip() or ticker
-                market = str(row.get("市場", "")).strip() or "UNKNOWN"
+                company_name = _cell(row, name_i).strip() or ticker
+                market = _cell(row, market_i).strip() or "UNKNOWN"
+                passes_market = market_verdicts.get(market)
+                if passes_market is None:
+                    passes_market = market_verdicts[market] = self._passes_market(market)
+                if not passes_market:
+                    continue
 
                 metrics: dict[str, float] = {}
-                self._put_metric(metrics, "latest_close", row.get("現在値"))
-                self._put_metric_from_columns(metrics, "per", row, ["PER(株価収益率)(予)(倍)", "PER(株価収益率)(倍)"])
-                self._put_metric_from_columns(metrics, "pbr", row, ["PBR(株価純資産倍率)(倍)"])
-                self._put_metric_from_columns(metrics, "dividend_yield", row, ["配当利回り(%)"])
-                self._put_metric_from_columns(metrics, "roe", row, ["ROE(自己資本利益率)(%)", "ROE(%)"])
-                self._put_metric_from_columns(metrics, "equity_ratio", row, ["自己資本比率(%)"])
-                self._put_metric_from_columns(metrics, "net_de_ratio", row, ["有利子負債自己資本比率(%)"])
-                self._put_metric_from_columns(metrics, "operating_margin", row, ["売上高営業利益率(%)"])
-                self._put_metric_from_columns(
-                    metrics,
-                    "revenue_growth_forecast",
-                    row,
-                    ["売上高成長率(予)(%)", "売上高変化率(%)"],
-                )
-                self._put_metric_from_columns(
-                    metrics,
-                    "op_income_growth_forecast",
-                    row,
-                    ["経常利益成長率(予)(%)", "経常利益変化率(%)"],
-                )
-                self._put_metric_from_columns(
-                    metrics,
-                    "revenue_cagr_3y",
-                    row,
-                    ["過去3年平均売上高成長率(予)(%)", "売上高変化率(%)"],
-                )
-                self._put_metric_from_columns(
-                    metrics,
-                    "op_income_cagr_3y",
-                    row,
-                    ["過去3年平均経常利益成長率(予)(%)", "経常利益変化率(%)"],
-                )
-
-                market_cap_million = _to_float(row.get("時価総額(百万円)"))
-                if market_cap_million is not None:
-                    metrics["market_cap_jpy"] = market_cap_million * 1_000_000
-
-                avg_turnover_thousand = _to_float(row.get("平均売買代金(千円)"))
-                if avg_turnover_thousand is not None:
-                    metrics["avg_turnover_20d"] = avg_turnover_thousand * 1_000
+                for key, indices, scale in metric_indices:
+                    for column_i in indices:
+                        value = _to_float(_cell(row, column_i))
+                        if value is not None:
+                            metrics[key] = value * scale if scale != 1 else value
+                            break
+                if not self._passes_liquidity(metrics):
+                    continue
 
                 rows.append(_SbiRecord(ticker=ticker, company_name=company_name, market=market, metrics=metrics))
 
+        write_disk_cache(
+            cache_path,
+            {
+                "version": _RECORDS_CACHE_VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "records": [[r.ticker, r.company_name, r.market, r.metrics] for r in rows],
+            },
+        )
+        return self._store_records(rows)
+
+    def _store_records(self, rows: list[_SbiRecord]) -> list[_SbiRecord]:
         self._records_cache = rows
+        # Later rows win on duplicate tickers, matching the previous linear scan.
+        self._records_by_ticker = {r.ticker: r for r in rows}
         return rows
 
     def _resolve_csv_path(self) -> Path:
@@ -117,64 +171,49 @@ class SbiCsvMarketDataCollector:
         csv_dir = self.data_source.constraints.get("csv_dir", "data/sbi_screening")
         pattern = self.data_source.constraints.get("csv_glob", "*.csv")
         path_dir = Path(str(csv_dir))
-        files = sorted(path_dir.glob(str(pattern)))
-        if not files:
+        latest = max(path_dir.glob(str(pattern)), default=None)
+        if latest is None:
             raise FileNotFoundError(f"No SBI CSV found: {path_dir}/{pattern}")
-        return files[-1]
+        return latest
 
-    def _passes_market(self, record: _SbiRecord) -> bool:
+    def _passes_market(self, market: str) -> bool:
         if self.universe_config.market != "TSE_PRIME":
             return True
-        return (
-            "東証P" in record.market
-            or "東P" in record.market
-            or "プライム" in record.market
-            or "Prime" in record.market
-        )
+        return any(token in market for token in _PRIME_MARKET_TOKENS)
 
-    def _passes_liquidity(self, record: _SbiRecord) -> bool:
-        avg_turnover = record.metrics.get("avg_turnover_20d")
+    def _passes_liquidity(self, metrics: dict[str, float]) -> bool:
+        avg_turnover = metrics.get("avg_turnover_20d")
         if avg_turnover is None:
             return False
         if avg_turnover < self.universe_config.min_avg_trading_value_20d_jpy:
             return False
 
-        market_cap = record.metrics.get("market_cap_jpy")
+        market_cap = metrics.get("market_cap_jpy")
         if market_cap is not None and market_cap < self.universe_config.min_market_cap_jpy:
             return False
         return True
 
-    @staticmethod
-    def _put_metric(metrics: dict[str, float], key: str, raw_value: Any) -> None:
-        value = _to_float(raw_value)
-        if value is not None:
-            metrics[key] = value
-
-    @classmethod
-    def _put_metric_from_columns(
-        cls,
-        metrics: dict[str, float],
-        key: str,
-        row: dict[str, Any],
-        column_names: list[str],
-    ) -> None:
-        for column_name in column_names:
-            raw_value = row.get(column_name)
-            value = _to_float(raw_value)
-            if value is None:
-                continue
-            metrics[key] = value
-            return
+
+def _cell(row: list[str], index: int | None) -> str:
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
 
 
 def _to_float(value: Any) -> float | None:
     if value is None:
         return None
-    text = str(value).strip()
-    if not text or text in {"-", "--", "---", "N/A", "n/a"}:
-        return None
-    text = text.replace(",", "").replace("%", "")
+    text = value if isinstance(value, str) else str(value)
+    # Most SBI cells are plain decimals; float() parses them (and surrounding whitespace)
+    # directly, so only separators, units and null tokens take the slower normalization path.
     try:
         return float(text)
+    except ValueError:
+        pass
+    text = text.strip()
+    if not text or text in _NULL_TOKENS:
+        return None
+    try:
+        return float(text.translate(_DROP_CHARS))
     except ValueError:
         return None
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
 
 @dataclass(slots=True)
 class DataSource:
@@ -42,6 +49,7 @@ class DeepDiveConfig:
     top_k: int
     news_lookback_days: int
     require_refutation_check: bool
+    use_batch_api: bool = False
 
 
 @dataclass(slots=True)
@@ -65,8 +73,15 @@ class StrategyConfig:
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as fh:
-        loaded = yaml.safe_load(fh)
+    # Deep-copy so callers may mutate the result without touching the cached parse.
+    return copy.deepcopy(_load_yaml_cached(str(path.resolve()), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    _ = mtime_ns  # Part of the cache key only: an edited file gets a fresh parse.
+    with open(path, "r", encoding="utf-8") as fh:
+        loaded = yaml.load(fh, Loader=_YamlSafeLoader)
     if not isinstance(loaded, dict):
         raise ValueError(f"Invalid strategy config: {path}")
     return loaded
@@ -5,10 +5,11 @@ import os
 from datetime import date
 from pathlib import Path
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
 from ai_investor.config import load_strategy
 from ai_investor.pipeline import InvestorPipeline
+from ai_investor.reporting.json_report import write_json_sidecar
 from ai_investor.reporting.markdown_report import write_report
 
 
@@ -20,19 +21,22 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--top-n", type=int, default=None)
     parser.add_argument("--top-k", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="Also write the result as JSON")
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Evaluate the deep dive through the OpenAI Batch API (overrides deep_dive.use_batch_api)",
+    )
     return parser.parse_args()
 
 
 def main() -> int:
+    args = parse_args()
     dotenv_path = Path.cwd() / ".env"
     if dotenv_path.is_file():
-        load_dotenv(dotenv_path=dotenv_path, override=False)
-        # If an empty env var is already set, prefer non-empty value from .env.
-        if not os.getenv("OPENAI_API_KEY", "").strip():
-            load_dotenv(dotenv_path=dotenv_path, override=True)
+        _apply_dotenv(dotenv_path)
     else:
         load_dotenv(override=False)
-    args = parse_args()
     strategy = load_strategy(args.config)
     missing_required_env = [
         key for key in strategy.runtime.required_env if not os.getenv(key, "").strip()
@@ -44,6 +48,8 @@ def main() -> int:
             "Set them in .env or your shell environment."
         )
     as_of = date.fromisoformat(args.as_of)
+    if args.batch_api:
+        strategy.deep_dive.use_batch_api = True
 
     pipeline = InvestorPipeline(strategy)
     result = pipeline.run(dry_run=args.dry_run, top_n=args.top_n, top_k=args.top_k, as_of=as_of)
@@ -55,8 +61,22 @@ def main() -> int:
 
     report_path = write_report(result, args.output, as_of)
     print(f"Report generated: {report_path}")
+    if args.json:
+        json_path = write_json_sidecar(result, args.output, as_of)
+        print(f"JSON generated: {json_path}")
     return 0
 
 
+def _apply_dotenv(dotenv_path: Path) -> None:
+    # Parse .env once. Unset variables are filled in, and an empty variable already set
+    # in the shell is replaced by a non-empty value from .env.
+    for key, value in dotenv_values(dotenv_path).items():
+        if value is None:
+            continue
+        current = os.environ.get(key)
+        if current is None or (value and not current.strip()):
+            os.environ[key] = value
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
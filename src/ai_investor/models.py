@@ -26,8 +26,10 @@ class Candidate:
     qualitative_score_normalized: float = 0.0
     composite_score: float = 0.0
     excluded: bool = False
-    exclusion_reasons: list[str] = field(default_factory=list)
-    evidence: list[Evidence] = field(default_factory=list)
+    # Immutable defaults: most candidates never get exclusion reasons or evidence, so
+    # sharing an empty tuple avoids two container allocations per universe row.
+    exclusion_reasons: tuple[str, ...] = ()
+    evidence: tuple[Evidence, ...] = ()
 
 
 @dataclass(slots=True)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import heapq
 from datetime import date
+from operator import attrgetter
 
 from ai_investor.collectors.fundamentals import EdinetCollector
 from ai_investor.collectors.market_data import JQuantsMarketDataCollector
@@ -11,6 +13,8 @@ from ai_investor.models import Candidate, PipelineResult
 from ai_investor.research.top3_deep_dive import build_recommendations
 from ai_investor.scoring import exclusion, qualitative, quantitative
 
+_COMPOSITE_SCORE = attrgetter("composite_score")
+
 
 class InvestorPipeline:
     def __init__(self, config: StrategyConfig) -> None:
@@ -64,9 +68,9 @@ class InvestorPipeline:
         for candidate in candidates:
             candidate.composite_score = candidate.quantitative_score + candidate.qualitative_score_normalized
 
-        ranked = sorted(candidates, key=lambda c: c.composite_score, reverse=True)
         selected_top_n = top_n or self.config.quantitative.top_n_candidates
-        shortlisted = ranked[:selected_top_n]
+        # Same order as sorted(..., reverse=True)[:n], without sorting the whole universe.
+        shortlisted = heapq.nlargest(selected_top_n, candidates, key=_COMPOSITE_SCORE)
         selected_top_k = top_k or self.config.deep_dive.top_k
         recommendations = build_recommendations(
             shortlisted,
@@ -75,6 +79,7 @@ class InvestorPipeline:
             tdnet=self.tdnet,
             news_lookback_days=self.config.deep_dive.news_lookback_days,
             as_of=as_of,
+            use_batch_api=self.config.deep_dive.use_batch_api,
         )
 
         return PipelineResult(candidates=shortlisted, top_recommendations=recommendations)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+
+from ai_investor.models import PipelineResult
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def write_json_sidecar(result: PipelineResult, output_dir: str | Path, as_of: date) -> Path:
+    """Write the pipeline result as machine-readable JSON next to the Markdown report."""
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    json_path = out_dir / f"{as_of.strftime('%Y%m%d')}_report.json"
+
+    if orjson is not None:
+        # orjson walks slots dataclasses natively, without building intermediate dicts.
+        json_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        json_path.write_text(json.dumps(asdict(result), ensure_ascii=False, indent=2), encoding="utf-8")
+    return json_path
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import io
+from functools import lru_cache
+
 from ai_investor.models import Candidate
 
 RAW_METRIC_COLUMNS: list[tuple[str, str]] = [
@@ -15,87 +18,106 @@ RAW_METRIC_COLUMNS: list[tuple[str, str]] = [
     ("revenue_cagr_3y", "過去3年平均売上高成長率(予)(%)"),
 ]
 
+_PREFERRED_AXIS_ORDER: tuple[str, ...] = (
+    "revenue_growth_strength",
+    "tam_expansion_potential",
+    "profit_structure_improvement",
+    "moat_strength",
+    "management_quality",
+    "financial_durability",
+    "valuation_reasonableness",
+    "temporary_lag_factor",
+    "growth_driver_confidence",
+    "management_and_capital_policy",
+    "competitive_advantage",
+    "risk_resilience",
+)
+
+_AXIS_LABELS: dict[str, str] = {
+    "revenue_growth_strength": "売上成長力",
+    "tam_expansion_potential": "TAM/拡張余地",
+    "profit_structure_improvement": "利益構造改善余地",
+    "moat_strength": "競争優位性(モート)",
+    "management_quality": "経営陣の質",
+    "financial_durability": "財務耐久力",
+    "valuation_reasonableness": "バリュエーション妥当性",
+    "temporary_lag_factor": "出遅れ要因の一時性",
+    "growth_driver_confidence": "成長ドライバーの実現確度",
+    "management_and_capital_policy": "経営品質・資本政策",
+    "competitive_advantage": "競争優位性",
+    "risk_resilience": "リスク耐性",
+}
+
 
 def to_markdown_table(candidates: list[Candidate]) -> str:
     axis_ids = _axis_columns(candidates)
-    axis_header = "".join(f"|{_axis_label(axis_id)}" for axis_id in axis_ids)
-    raw_header = "".join(f"|{title}" for _, title in RAW_METRIC_COLUMNS)
-    header = (
-        f"|Ticker|Company|Sector|Quant|Q(Price)|Q(Fund)|Qual(100)|QualRaw|Composite|Excluded|Reasons{axis_header}{raw_header}|\n"
-        f"|---|---|---|---:|---:|---:|---:|---:|---:|---|---{''.join('|---:' for _ in axis_ids)}{''.join('|---:' for _ in RAW_METRIC_COLUMNS)}|"
-    )
-    rows = []
+    raw_columns = tuple(RAW_METRIC_COLUMNS)
+    # Fragments stream into one buffer instead of being held in a list until a final join.
+    buf = io.StringIO()
+    append = buf.write
+    append(_table_header(axis_ids, raw_columns))
+    metric_ids = tuple(metric_id for metric_id, _ in raw_columns)
     for candidate in candidates:
-        axis_values = "".join(
-            f"|{candidate.qualitative_scores.get(axis_id, 0.0):.2f}"
-            for axis_id in axis_ids
+        append(
+            f"\n|{candidate.ticker}|{candidate.company_name}|{candidate.sector}"
+            f"|{candidate.quantitative_score:.2f}"
+            f"|{candidate.quantitative_score_price_now:.2f}"
+            f"|{candidate.quantitative_score_fundamentals_base:.2f}"
+            f"|{candidate.qualitative_score_normalized:.2f}"
+            f"|{candidate.qualitative_score_total:.2f}"
+            f"|{candidate.composite_score:.2f}"
+            f"|{'yes' if candidate.excluded else 'no'}"
+            f"|{', '.join(candidate.exclusion_reasons)}"
         )
-        raw_values = "".join(
-            f"|{_format_metric(candidate.quantitative_metrics.get(metric_id))}"
-            for metric_id, _ in RAW_METRIC_COLUMNS
-        )
-        rows.append(
-            "|{ticker}|{name}|{sector}|{quant:.2f}|{q_price:.2f}|{q_fund:.2f}|{qual_100:.2f}|{qual_raw:.2f}|{comp:.2f}|{excluded}|{reasons}{axis_values}{raw_values}|".format(
-                ticker=candidate.ticker,
-                name=candidate.company_name,
-                sector=candidate.sector,
-                quant=candidate.quantitative_score,
-                q_price=candidate.quantitative_score_price_now,
-                q_fund=candidate.quantitative_score_fundamentals_base,
-                qual_100=candidate.qualitative_score_normalized,
-                qual_raw=candidate.qualitative_score_total,
-                comp=candidate.composite_score,
-                excluded="yes" if candidate.excluded else "no",
-                reasons=", ".join(candidate.exclusion_reasons),
-                axis_values=axis_values,
-                raw_values=raw_values,
-            )
-        )
-    return header + ("\n" + "\n".join(rows) if rows else "")
-
-
-def _axis_columns(candidates: list[Candidate]) -> list[str]:
-    preferred_order = [
-        "revenue_growth_strength",
-        "tam_expansion_potential",
-        "profit_structure_improvement",
-        "moat_strength",
-        "management_quality",
-        "financial_durability",
-        "valuation_reasonableness",
-        "temporary_lag_factor",
-        "growth_driver_confidence",
-        "management_and_capital_policy",
-        "competitive_advantage",
-        "risk_resilience",
-    ]
-    present: set[str] = set()
-    for candidate in candidates:
-        present.update(candidate.qualitative_scores.keys())
-    ordered = [axis_id for axis_id in preferred_order if axis_id in present]
-    extras = sorted(axis_id for axis_id in present if axis_id not in preferred_order)
-    return ordered + extras
-
-
-def _axis_label(axis_id: str) -> str:
-    labels = {
-        "revenue_growth_strength": "売上成長力",
-        "tam_expansion_potential": "TAM/拡張余地",
-        "profit_structure_improvement": "利益構造改善余地",
-        "moat_strength": "競争優位性(モート)",
-        "management_quality": "経営陣の質",
-        "financial_durability": "財務耐久力",
-        "valuation_reasonableness": "バリュエーション妥当性",
-        "temporary_lag_factor": "出遅れ要因の一時性",
-        "growth_driver_confidence": "成長ドライバーの実現確度",
-        "management_and_capital_policy": "経営品質・資本政策",
-        "competitive_advantage": "競争優位性",
-        "risk_resilience": "リスク耐性",
-    }
-    return labels.get(axis_id, axis_id)
+        # Column sets are fixed per call; skip the per-candidate lookups entirely when a set is empty.
+        if axis_ids:
+            scores_get = candidate.qualitative_scores.get
+            for axis_id in axis_ids:
+                append(_score_cell(scores_get(axis_id, 0.0)))
+        if metric_ids:
+            metrics_get = candidate.quantitative_metrics.get
+            for metric_id in metric_ids:
+                append(f"|{_format_metric(metrics_get(metric_id))}")
+        append("|")
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=32)
+def _table_header(axis_ids: tuple[str, ...], raw_columns: tuple[tuple[str, str], ...]) -> str:
+    # Runs of the same strategy share one axis set, so the header is built once per signature.
+    label = _AXIS_LABELS.get
+    axis_header = "".join(f"|{label(axis_id, axis_id)}" for axis_id in axis_ids)
+    raw_header = "".join(f"|{title}" for _, title in raw_columns)
+    return (
+        f"|Ticker|Company|Sector|Quant|Q(Price)|Q(Fund)|Qual(100)|QualRaw|Composite|Excluded|Reasons{axis_header}{raw_header}|\n"
+        f"|---|---|---|---:|---:|---:|---:|---:|---:|---|---{'|---:' * len(axis_ids)}{'|---:' * len(raw_columns)}|"
+    )
+
+
+def _axis_columns(candidates: list[Candidate]) -> tuple[str, ...]:
+    # frozenset.union iterates each scores dict's keys in C.
+    present: frozenset[str] = frozenset().union(*(c.qualitative_scores for c in candidates))
+    return _order_axes(present)
+
+
+@lru_cache(maxsize=8)
+def _order_axes(present: frozenset[str]) -> tuple[str, ...]:
+    ordered = [axis_id for axis_id in _PREFERRED_AXIS_ORDER if axis_id in present]
+    extras = sorted(axis_id for axis_id in present if axis_id not in _PREFERRED_AXIS_ORDER)
+    return (*ordered, *extras)
+
+
+@lru_cache(maxsize=4096)
+def _score_cell(value: float) -> str:
+    # Axis scores are coarse (rounded 0-5 averages), so a handful of cells repeat across every row.
+    return f"|{value:.2f}"
 
 
 def _format_metric(value: object) -> str:
-    if not isinstance(value, (int, float)):
+    # Missing metrics are the common non-numeric case; anything else unformattable also renders as "-".
+    if value is None:
+        return "-"
+    try:
+        return f"{value:.2f}"
+    except (TypeError, ValueError):
         return "-"
-    return f"{float(value):.2f}"
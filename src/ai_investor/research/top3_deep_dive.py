@@ -1,22 +1,130 @@
 from __future__ import annotations
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
+import hashlib
+import heapq
+from itertools import chain, islice
 import json
+import logging
+from operator import attrgetter, itemgetter
 import os
+from pathlib import Path
 import re
+import threading
+import time
+from typing import Any, NamedTuple
 
 import requests
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from ai_investor.cache import disk_cache_path, read_disk_cache, write_disk_cache
 from ai_investor.collectors.news import NewsItem, TdnetPublicCollector, WebSearchNewsCollector
 from ai_investor.models import Candidate, Recommendation
 
 AI_DEFAULT_MODEL = "gpt-4o-mini"
 AI_TIMEOUT_SECONDS = 30
+AI_DEFAULT_MAX_TOKENS = 1200
+AI_SEED = 42
 
+LOGGER = logging.getLogger(__name__)
 
-@dataclass(slots=True)
-class _AIEvaluation:
+_AXIS_KEYS: tuple[str, ...] = (
+    "valuation_attractiveness",
+    "financial_quality",
+    "catalyst_strength",
+    "downside_risk_control",
+    "evidence_quality",
+)
+_VALID_DECISIONS = frozenset({"Recommend", "Watch", "Skip"})
+_COMPOSITE_SCORE = attrgetter("composite_score")
+
+_SYSTEM_PROMPT = (
+    "あなたは日本株アナリストです。入力データのみを根拠に、"
+    "投資判断を0-100点へポイント換算してください。"
+    "キーワード機械判定ではなく、文脈・整合性・リスクの強弱で評価します。"
+    "さらに、出遅れ原因を具体的に特定し、投資判断に対する批判的意見も提示してください。"
+    "あわせて、業種の景気動向・傾向と、同業比較での強み・弱みを明示してください。"
+    "以下5軸を0-5で採点し、平均×20をtotal_scoreにしてください。"
+    "1) valuation_attractiveness 2) financial_quality 3) catalyst_strength "
+    "4) downside_risk_control 5) evidence_quality。"
+    "decisionは Recommend/Watch/Skip のいずれか。"
+    "一般論の文言は禁止です。"
+    "「業績が予想を上回る場合、再評価の可能性」「市場全体の景気後退が影響を及ぼす可能性がある」"
+    "のような抽象表現を使わず、必ず当該企業固有の数値・出来事を入れてください。"
+    "出力はJSONのみで返してください。"
+)
+_USER_PROMPT_SCHEMA = (
+    "出力JSONスキーマ:\n"
+    "{"
+    '"axis_scores":{"valuation_attractiveness":0-5,"financial_quality":0-5,"catalyst_strength":0-5,'
+    '"downside_risk_control":0-5,"evidence_quality":0-5},'
+    '"total_score":0-100,'
+    '"decision":"Recommend|Watch|Skip",'
+    '"business_overview":"40文字以内の業務概要",'
+    '"reasons":["...最大3件"],'
+    '"risks":["...最大3件"],'
+    '"assumptions":["...最大3件"],'
+    '"industry_trends":["...業種の景気動向・傾向を最大3件"],'
+    '"peer_strengths":["...同業比較での強みを最大3件"],'
+    '"peer_weaknesses":["...同業比較での弱みを最大3件"],'
+    '"lag_causes":["...具体的な出遅れ原因を最大3件"],'
+    '"critical_views":["...投資判断への批判的意見を最大3件"],'
+    '"break_scenarios":["...最大3件"],'
+    '"reevaluation_triggers":["...最大3件"]'
+    "}"
+)
+# Fixed schema first, per-candidate data last: the byte-identical prefix is what the
+# API's automatic prompt caching can reuse across candidates and runs.
+_USER_PROMPT_PREFIX = f"{_USER_PROMPT_SCHEMA}\n次のJSONデータを評価してください。\n"
+_GROUPED_USER_PROMPT_PREFIX = (
+    f"{_USER_PROMPT_SCHEMA}\n"
+    "次のJSONデータの items に含まれる各銘柄を互いに独立して評価し、"
+    '{"results":{"<ticker>":上記スキーマのJSON}} の形式で全銘柄分を返してください。\n'
+)
+_PROMPT_TITLE_CHARS = 120
+_PROMPT_SOURCE_CHARS = 32
+_PROMPT_SUMMARY_CHARS = 160
+_SYSTEM_MESSAGE: dict[str, str] = {"role": "system", "content": _SYSTEM_PROMPT}
+_PROMPT_FINGERPRINT = hashlib.sha256(f"{_SYSTEM_PROMPT}\n{_USER_PROMPT_SCHEMA}".encode("utf-8")).hexdigest()[:16]
+
+# Shared across calls (and deep-dive threads) so the API connection is pooled instead of
+# paying a TLS handshake per candidate.
+_SESSION = requests.Session()
+# API calls are retried on rate limits and transient server errors with jittered exponential
+# backoff (honouring Retry-After) before the caller falls back to the rule-based evaluation.
+_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=4,
+        backoff_factor=1.0,
+        backoff_jitter=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    ),
+)
+# Plain http is covered too, for OPENAI_BASE_URL pointing at a local gateway or proxy.
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+# Spaces out request starts when OPENAI_MAX_RPM is set, so concurrent deep dives stay under the
+# account's requests-per-minute limit instead of tripping 429s.
+_RATE_LOCK = threading.Lock()
+_next_request_at = 0.0
+
+
+class _AIEvaluation(NamedTuple):
     total_score: float
     decision: str
     business_overview: str
@@ -40,45 +148,92 @@ def build_recommendations(
     tdnet: TdnetPublicCollector | None = None,
     news_lookback_days: int = 30,
     as_of: date | None = None,
+    use_batch_api: bool = False,
 ) -> list[Recommendation]:
-    ranked = sorted(
-        [c for c in candidates if not c.excluded],
-        key=lambda c: c.composite_score,
-        reverse=True,
-    )
-    selected = ranked[:top_k]
-    recommendations: list[Recommendation] = []
-    for candidate in selected:
-        news_items = _collect_news(
+    eligible = [c for c in candidates if not c.excluded]
+    selected = heapq.nlargest(top_k, eligible, key=_COMPOSITE_SCORE)
+    if not selected:
+        return []
+    peer_ranks = _PeerRanks(eligible)
+    max_workers = min(max(1, _env_int("AI_DEEP_DIVE_CONCURRENCY", 4)), len(selected))
+    # TDnet lookups get their own pool so each worker can overlap them with its web search
+    # without waiting on a slot in the (possibly saturated) deep-dive pool.
+    news_executor = ThreadPoolExecutor(max_workers=max_workers) if web_news is not None and tdnet is not None else None
+
+    def collect(candidate: Candidate) -> list[NewsItem]:
+        return _collect_news(
             candidate,
             web_news=web_news,
             tdnet=tdnet,
             lookback_days=news_lookback_days,
             as_of=as_of,
+            executor=news_executor,
         )
-        evaluation = _evaluate_candidate(candidate, news_items, as_of, peer_candidates=ranked)
-        links = _build_source_links(news_items)
-
-        recommendations.append(
-            Recommendation(
-                ticker=candidate.ticker,
-                decision=evaluation.decision,
-                company_name=candidate.company_name,
-                business_overview=evaluation.business_overview,
-                reasons=evaluation.reasons,
-                risks=evaluation.risks,
-                assumptions=evaluation.assumptions,
-                industry_trends=evaluation.industry_trends,
-                peer_strengths=evaluation.peer_strengths,
-                peer_weaknesses=evaluation.peer_weaknesses,
-                lag_causes=evaluation.lag_causes,
-                critical_views=evaluation.critical_views,
-                break_scenarios=evaluation.break_scenarios,
-                reevaluation_triggers=evaluation.reevaluation_triggers,
-                source_links=links,
-            )
-        )
-    return recommendations
+
+    def deep_dive(candidate: Candidate) -> Recommendation:
+        news_items = collect(candidate)
+        evaluation = _evaluate_candidate(candidate, news_items, as_of, peer_ranks=peer_ranks)
+        return _to_recommendation(candidate, evaluation, news_items)
+
+    # News fetches and LLM calls are network-bound, so candidates are evaluated concurrently;
+    # executor.map keeps the recommendations in ranked order.
+    group_size = max(1, _env_int("OPENAI_CANDIDATES_PER_REQUEST", 1))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Without an API key every candidate takes the rule-based path, so there is nothing to
+            # batch or group and no reason to wait for all news before evaluating.
+            if not _openai_settings().api_key or (not use_batch_api and group_size == 1):
+                return list(executor.map(deep_dive, selected))
+
+            # Batch / grouped mode: gather every prompt first, submit them together (one Batch API
+            # job, or chat requests of group_size candidates), and only evaluate live (or by rules)
+            # the candidates that were not answered.
+            news_by_candidate = list(executor.map(collect, selected))
+            if use_batch_api:
+                batch_results = _evaluate_batch(selected, news_by_candidate, as_of, peer_ranks=peer_ranks)
+            else:
+                batch_results = {}
+                for group_results in executor.map(
+                    lambda start: _evaluate_grouped(
+                        selected[start : start + group_size],
+                        news_by_candidate[start : start + group_size],
+                        as_of,
+                        peer_ranks=peer_ranks,
+                    ),
+                    range(0, len(selected), group_size),
+                ):
+                    batch_results.update(group_results)
+
+            def finish(candidate: Candidate, news_items: list[NewsItem]) -> Recommendation:
+                evaluation = batch_results.get(candidate.ticker)
+                if evaluation is None:
+                    evaluation = _evaluate_candidate(candidate, news_items, as_of, peer_ranks=peer_ranks)
+                return _to_recommendation(candidate, evaluation, news_items)
+
+            return list(executor.map(finish, selected, news_by_candidate))
+    finally:
+        if news_executor is not None:
+            news_executor.shutdown()
+
+
+def _to_recommendation(candidate: Candidate, evaluation: _AIEvaluation, news_items: list[NewsItem]) -> Recommendation:
+    return Recommendation(
+        ticker=candidate.ticker,
+        decision=evaluation.decision,
+        company_name=candidate.company_name,
+        business_overview=evaluation.business_overview,
+        reasons=evaluation.reasons,
+        risks=evaluation.risks,
+        assumptions=evaluation.assumptions,
+        industry_trends=evaluation.industry_trends,
+        peer_strengths=evaluation.peer_strengths,
+        peer_weaknesses=evaluation.peer_weaknesses,
+        lag_causes=evaluation.lag_causes,
+        critical_views=evaluation.critical_views,
+        break_scenarios=evaluation.break_scenarios,
+        reevaluation_triggers=evaluation.reevaluation_triggers,
+        source_links=_build_source_links(news_items),
+    )
 
 
 def _collect_news(
@@ -88,12 +243,22 @@ def _collect_news(
     tdnet: TdnetPublicCollector | None,
     lookback_days: int,
     as_of: date | None,
+    executor: ThreadPoolExecutor | None = None,
 ) -> list[NewsItem]:
+    if web_news is None and tdnet is None:
+        return []
+    tdnet_future = None
+    if tdnet is not None and web_news is not None and executor is not None:
+        tdnet_future = executor.submit(
+            tdnet.fetch_news, ticker=candidate.ticker, lookback_days=lookback_days, as_of=as_of
+        )
     items: list[NewsItem] = []
     if web_news is not None:
         query = f'"{candidate.company_name}" OR "{candidate.ticker}"'
         items.extend(web_news.fetch_news(query=query, lookback_days=lookback_days, as_of=as_of))
-    if tdnet is not None:
+    if tdnet_future is not None:
+        items.extend(tdnet_future.result())
+    elif tdnet is not None:
         items.extend(tdnet.fetch_news(ticker=candidate.ticker, lookback_days=lookback_days, as_of=as_of))
     return _dedupe_by_url(items)
 
@@ -103,39 +268,356 @@ def _evaluate_candidate(
     news_items: list[NewsItem],
     as_of: date | None,
     *,
-    peer_candidates: list[Candidate],
+    peer_ranks: _PeerRanks,
 ) -> _AIEvaluation:
-    ai_eval = _evaluate_with_llm(candidate, news_items, as_of, peer_candidates=peer_candidates)
+    ai_eval = _evaluate_with_llm(candidate, news_items, as_of, peer_ranks=peer_ranks)
     if ai_eval is not None:
         return ai_eval
-    return _fallback_evaluation(candidate, news_items, peer_candidates=peer_candidates)
+    return _fallback_evaluation(candidate, news_items, peer_ranks=peer_ranks)
 
 def _evaluate_with_llm(
     candidate: Candidate,
     news_items: list[NewsItem],
     as_of: date | None,
     *,
-    peer_candidates: list[Candidate],
+    peer_ranks: _PeerRanks,
 ) -> _AIEvaluation | None:
-    api_key = os.getenv("OPENAI_API_KEY", "").strip()
-    if not api_key:
+    settings = _openai_settings()
+    if not settings.api_key:
         return None
 
-    model = os.getenv("OPENAI_MODEL", AI_DEFAULT_MODEL).strip() or AI_DEFAULT_MODEL
-    api_base = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
-    endpoint = f"{api_base}/chat/completions"
+    body_obj = _build_llm_body(candidate, news_items, as_of, peer_ranks=peer_ranks)
+    body = _dumps(body_obj)
+    cache_paths = _llm_cache_paths(body, candidate, news_items)
+    cached = _read_llm_cache(cache_paths)
+    if cached is not None:
+        evaluation = _parse_llm_content(cached, candidate, news_items, peer_ranks=peer_ranks)
+        if evaluation is not None:
+            return evaluation
+
+    # Streaming keeps bytes flowing while the answer is generated, so the read timeout applies
+    # per chunk rather than to the whole completion. The cache key stays the non-streamed body.
+    stream = settings.stream
+    try:
+        _wait_for_rate_limit()
+        response = _SESSION.post(
+            f"{settings.api_base}/chat/completions",
+            headers=_openai_headers(settings.api_key),
+            data=_dumps({**body_obj, "stream": True}) if stream else body,
+            timeout=AI_TIMEOUT_SECONDS,
+            stream=stream,
+        )
+        response.raise_for_status()
+        if stream:
+            content = _read_streamed_content(response)
+        else:
+            content = _loads(response.content)["choices"][0]["message"]["content"]
+    except (requests.RequestException, ValueError) as exc:
+        LOGGER.warning("OpenAI evaluation for %s failed; using rule-based fallback: %s", candidate.ticker, exc)
+        return None
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+    evaluation = _parse_llm_content(content, candidate, news_items, peer_ranks=peer_ranks)
+    if evaluation is not None:
+        _write_llm_cache(cache_paths, content)
+    return evaluation
+
+
+def _read_streamed_content(response: requests.Response) -> str:
+    """Join the content deltas of a streamed chat completion (server-sent events)."""
+    parts: list[str] = []
+    with response:
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            for choice in _loads(data).get("choices") or ():
+                piece = (choice.get("delta") or {}).get("content")
+                if piece:
+                    parts.append(piece)
+    return "".join(parts)
+
+
+def _evaluate_grouped(
+    candidates: list[Candidate],
+    news_by_candidate: list[list[NewsItem]],
+    as_of: date | None,
+    *,
+    peer_ranks: _PeerRanks,
+) -> dict[str, _AIEvaluation]:
+    """Evaluate several candidates in one chat request; returns evaluations by ticker.
+
+    The system prompt and schema are sent once for the whole group. Candidates the model
+    skipped, or whose entry fails validation, are left for the caller to evaluate live.
+    """
+    settings = _openai_settings()
+    if not settings.api_key:
+        return {}
+
+    results: dict[str, _AIEvaluation] = {}
+    jobs: dict[str, tuple[Candidate, list[NewsItem], tuple[Path, ...]]] = {}
+    payloads: list[dict[str, Any]] = []
+    for candidate, news_items in zip(candidates, news_by_candidate):
+        # Cache entries stay keyed by the single-candidate request, so grouped and live runs share them.
+        payload_obj = _build_llm_payload(candidate, news_items, as_of, peer_ranks=peer_ranks)
+        cache_paths = _llm_cache_paths(_dumps(_single_chat_body(payload_obj)), candidate, news_items)
+        cached = _read_llm_cache(cache_paths)
+        if cached is not None:
+            evaluation = _parse_llm_content(cached, candidate, news_items, peer_ranks=peer_ranks)
+            if evaluation is not None:
+                results[candidate.ticker] = evaluation
+                continue
+        jobs[candidate.ticker] = (candidate, news_items, cache_paths)
+        payloads.append(payload_obj)
+    if not payloads:
+        return results
+
+    body = _chat_body(
+        _GROUPED_USER_PROMPT_PREFIX + _dumps({"items": payloads}).decode("utf-8"),
+        max_tokens=settings.max_tokens * len(payloads),
+    )
+    try:
+        _wait_for_rate_limit()
+        response = _SESSION.post(
+            f"{settings.api_base}/chat/completions",
+            headers=_openai_headers(settings.api_key),
+            data=_dumps(body),
+            timeout=AI_TIMEOUT_SECONDS * len(payloads),
+        )
+        response.raise_for_status()
+        grouped = _loads(_loads(response.content)["choices"][0]["message"]["content"])["results"]
+    except (requests.RequestException, ValueError, KeyError, IndexError, TypeError) as exc:
+        LOGGER.warning("Grouped OpenAI evaluation failed; falling back to per-candidate calls: %s", exc)
+        return results
+    if not isinstance(grouped, dict):
+        return results
+
+    for ticker, (candidate, news_items, cache_paths) in jobs.items():
+        entry = grouped.get(ticker)
+        if not isinstance(entry, dict):
+            continue
+        content = _dumps(entry).decode("utf-8")
+        evaluation = _parse_llm_content(content, candidate, news_items, peer_ranks=peer_ranks)
+        if evaluation is not None:
+            results[ticker] = evaluation
+            _write_llm_cache(cache_paths, content)
+    return results
+
+
+def _evaluate_batch(
+    candidates: list[Candidate],
+    news_by_candidate: list[list[NewsItem]],
+    as_of: date | None,
+    *,
+    peer_ranks: _PeerRanks,
+) -> dict[str, _AIEvaluation]:
+    """Evaluate candidates through one OpenAI Batch API job; returns evaluations by ticker.
+
+    Any failure or timeout returns what was parsed so far (usually nothing) and the caller
+    evaluates the remaining candidates through the live endpoint.
+    """
+    settings = _openai_settings()
+    api_key = settings.api_key
+    if not api_key:
+        return {}
+
+    api_base = settings.api_base
+    auth = {"Authorization": f"Bearer {api_key}"}
+    poll_seconds = settings.batch_poll_seconds
+    max_wait_seconds = settings.batch_max_wait_seconds
+
+    results: dict[str, _AIEvaluation] = {}
+    jobs: dict[str, tuple[Candidate, list[NewsItem], tuple[Path, ...]]] = {}
+    lines: list[bytes] = []
+    for candidate, news_items in zip(candidates, news_by_candidate):
+        body = _build_llm_body(candidate, news_items, as_of, peer_ranks=peer_ranks)
+        cache_paths = _llm_cache_paths(_dumps(body), candidate, news_items)
+        cached = _read_llm_cache(cache_paths)
+        if cached is not None:
+            evaluation = _parse_llm_content(cached, candidate, news_items, peer_ranks=peer_ranks)
+            if evaluation is not None:
+                results[candidate.ticker] = evaluation
+                continue
+        jobs[candidate.ticker] = (candidate, news_items, cache_paths)
+        lines.append(
+            _dumps({"custom_id": candidate.ticker, "method": "POST", "url": "/v1/chat/completions", "body": body})
+        )
+    if not lines:
+        return results
 
+    try:
+        upload = _SESSION.post(
+            f"{api_base}/files",
+            headers=auth,
+            data={"purpose": "batch"},
+            files={"file": ("deep_dive.jsonl", b"\n".join(lines), "application/jsonl")},
+            timeout=AI_TIMEOUT_SECONDS,
+        )
+        upload.raise_for_status()
+        created = _SESSION.post(
+            f"{api_base}/batches",
+            headers=_openai_headers(api_key),
+            data=_dumps(
+                {
+                    "input_file_id": _loads(upload.content)["id"],
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h",
+                }
+            ),
+            timeout=AI_TIMEOUT_SECONDS,
+        )
+        created.raise_for_status()
+        batch = _loads(created.content)
+
+        deadline = time.monotonic() + max_wait_seconds
+        while batch.get("status") not in {"completed", "failed", "expired", "cancelled"}:
+            if time.monotonic() >= deadline:
+                LOGGER.warning("OpenAI batch %s still %s; falling back to live calls", batch.get("id"), batch.get("status"))
+                return results
+            time.sleep(poll_seconds)
+            polled = _SESSION.get(f"{api_base}/batches/{batch['id']}", headers=auth, timeout=AI_TIMEOUT_SECONDS)
+            polled.raise_for_status()
+            batch = _loads(polled.content)
+
+        output_file_id = batch.get("output_file_id")
+        if batch.get("status") != "completed" or not output_file_id:
+            LOGGER.warning("OpenAI batch %s ended as %s; falling back to live calls", batch.get("id"), batch.get("status"))
+            return results
+        output = _SESSION.get(f"{api_base}/files/{output_file_id}/content", headers=auth, timeout=AI_TIMEOUT_SECONDS)
+        output.raise_for_status()
+    except (requests.RequestException, ValueError, KeyError, TypeError) as exc:
+        LOGGER.warning("OpenAI batch evaluation failed; falling back to live calls: %s", exc)
+        return results
+
+    for line in output.content.splitlines():
+        try:
+            row = _loads(line)
+            ticker = row["custom_id"]
+            content = row["response"]["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError, ValueError):
+            continue
+        if ticker not in jobs:
+            continue
+        candidate, news_items, cache_paths = jobs[ticker]
+        evaluation = _parse_llm_content(content, candidate, news_items, peer_ranks=peer_ranks)
+        if evaluation is not None:
+            results[ticker] = evaluation
+            _write_llm_cache(cache_paths, content)
+    return results
+
+
+def _llm_cache_paths(body: bytes, candidate: Candidate, news_items: list[NewsItem]) -> tuple[Path, ...]:
+    # The request body fixes the model, prompt, metrics, news and as_of, so identical bodies
+    # can reuse the earlier answer.
+    paths = [disk_cache_path(f"llm/{hashlib.sha256(body).hexdigest()}.json", disable_env="OPENAI_DISABLE_CACHE")]
+    if _openai_settings().near_duplicate_cache:
+        paths.append(
+            disk_cache_path(
+                f"llm/near_{hashlib.sha256(_near_duplicate_key(candidate, news_items)).hexdigest()}.json",
+                disable_env="OPENAI_DISABLE_CACHE",
+            )
+        )
+    return tuple(path for path in paths if path is not None)
+
+
+def _near_duplicate_key(candidate: Candidate, news_items: list[NewsItem]) -> bytes:
+    # Same ticker, prompt and news set, with metrics coarsened to one decimal and as_of / peer
+    # ranks left out: day-to-day reruns whose inputs barely moved reuse the earlier answer.
+    # Evaluations are never shared across tickers because their text is company-specific.
+    return _dumps(
+        [
+            _openai_settings().model,
+            _PROMPT_FINGERPRINT,
+            candidate.ticker,
+            sorted(
+                (key, round(value, 1))
+                for key, value in candidate.quantitative_metrics.items()
+                if isinstance(value, (int, float))
+            ),
+            sorted(item.url for item in news_items[:10]),
+        ]
+    )
+
+
+def _read_llm_cache(paths: tuple[Path, ...]) -> str | None:
+    ttl_seconds = _openai_settings().cache_ttl_seconds
+    for path in paths:
+        cached = read_disk_cache(path)
+        content = cached.get("content")
+        if not isinstance(content, str):
+            continue
+        try:
+            created_at = float(cached.get("created_at", 0.0))
+        except (TypeError, ValueError):
+            # A hand-edited or foreign entry is a cache miss, like an unreadable file.
+            continue
+        if time.time() - created_at > ttl_seconds:
+            continue
+        try:
+            os.utime(path)  # mtime tracks last use for the LRU sweep.
+        except OSError:
+            pass
+        return content
+    return None
+
+
+def _write_llm_cache(paths: tuple[Path, ...], content: str) -> None:
+    if not paths:
+        return
+    created_at = time.time()
+    for path in paths:
+        write_disk_cache(path, {"created_at": created_at, "content": content})
+    cache_dir = paths[0].parent
+    max_entries = _openai_settings().cache_max_entries
+    try:
+        entries = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(cache_dir) if entry.name.endswith(".json")]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, stale_path in entries[: len(entries) - max_entries]:
+        try:
+            os.remove(stale_path)
+        except OSError:
+            pass
+
+
+def _build_llm_body(
+    candidate: Candidate,
+    news_items: list[NewsItem],
+    as_of: date | None,
+    *,
+    peer_ranks: _PeerRanks,
+) -> dict[str, Any]:
+    return _single_chat_body(_build_llm_payload(candidate, news_items, as_of, peer_ranks=peer_ranks))
+
+
+def _single_chat_body(payload_obj: dict[str, Any]) -> dict[str, Any]:
+    return _chat_body(_USER_PROMPT_PREFIX + _dumps(payload_obj).decode("utf-8"), max_tokens=_openai_settings().max_tokens)
+
+
+def _build_llm_payload(
+    candidate: Candidate,
+    news_items: list[NewsItem],
+    as_of: date | None,
+    *,
+    peer_ranks: _PeerRanks,
+) -> dict[str, Any]:
+    # URLs carry no evaluative signal (they only feed source_links), and long titles/summaries
+    # are clipped so input tokens stay bounded per news item.
     news_for_prompt = [
         {
-            "title": item.title,
-            "source": item.source,
+            "title": item.title[:_PROMPT_TITLE_CHARS],
+            "source": item.source[:_PROMPT_SOURCE_CHARS],
             "published_at": item.published_at,
-            "url": item.url,
-            "summary": item.summary,
+            "summary": item.summary[:_PROMPT_SUMMARY_CHARS],
         }
         for item in news_items[:10]
     ]
-    payload_obj = {
+    return {
         "as_of": as_of.isoformat() if as_of is not None else None,
         "ticker": candidate.ticker,
         "company_name": candidate.company_name,
@@ -146,84 +628,105 @@ def _evaluate_with_llm(
         "qualitative_score_max": round(candidate.qualitative_score_max, 2),
         "qualitative_score_100": round(candidate.qualitative_score_normalized, 2),
         "quantitative_metrics": candidate.quantitative_metrics,
-        "peer_snapshot": _build_peer_snapshot(candidate, peer_candidates),
+        "peer_snapshot": peer_ranks.snapshot(candidate),
         "news": news_for_prompt,
     }
 
-    system_prompt = (
-        "あなたは日本株アナリストです。入力データのみを根拠に、"
-        "投資判断を0-100点へポイント換算してください。"
-        "キーワード機械判定ではなく、文脈・整合性・リスクの強弱で評価します。"
-        "さらに、出遅れ原因を具体的に特定し、投資判断に対する批判的意見も提示してください。"
-        "あわせて、業種の景気動向・傾向と、同業比較での強み・弱みを明示してください。"
-        "以下5軸を0-5で採点し、平均×20をtotal_scoreにしてください。"
-        "1) valuation_attractiveness 2) financial_quality 3) catalyst_strength "
-        "4) downside_risk_control 5) evidence_quality。"
-        "decisionは Recommend/Watch/Skip のいずれか。"
-        "一般論の文言は禁止です。"
-        "「業績が予想を上回る場合、再評価の可能性」「市場全体の景気後退が影響を及ぼす可能性がある」"
-        "のような抽象表現を使わず、必ず当該企業固有の数値・出来事を入れてください。"
-        "出力はJSONのみで返してください。"
-    )
-    user_prompt = (
-        "次のJSONデータを評価してください。\n"
-        f"{json.dumps(payload_obj, ensure_ascii=False)}\n"
-        "出力JSONスキーマ:\n"
-        "{"
-        '"axis_scores":{"valuation_attractiveness":0-5,"financial_quality":0-5,"catalyst_strength":0-5,'
-        '"downside_risk_control":0-5,"evidence_quality":0-5},'
-        '"total_score":0-100,'
-        '"decision":"Recommend|Watch|Skip",'
-        '"business_overview":"40文字以内の業務概要",'
-        '"reasons":["...最大3件"],'
-        '"risks":["...最大3件"],'
-        '"assumptions":["...最大3件"],'
-        '"industry_trends":["...業種の景気動向・傾向を最大3件"],'
-        '"peer_strengths":["...同業比較での強みを最大3件"],'
-        '"peer_weaknesses":["...同業比較での弱みを最大3件"],'
-        '"lag_causes":["...具体的な出遅れ原因を最大3件"],'
-        '"critical_views":["...投資判断への批判的意見を最大3件"],'
-        '"break_scenarios":["...最大3件"],'
-        '"reevaluation_triggers":["...最大3件"]'
-        "}"
-    )
 
-    body = {
-        "model": model,
-        "temperature": 0.1,
+def _chat_body(user_prompt: str, *, max_tokens: int) -> dict[str, Any]:
+    return {
+        "model": _openai_settings().model,
+        "temperature": 0.0,
+        "seed": AI_SEED,
+        "max_tokens": max_tokens,
         "response_format": {"type": "json_object"},
         "messages": [
-            {"role": "system", "content": system_prompt},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": user_prompt},
         ],
     }
-    headers = {
+
+
+@dataclass(frozen=True, slots=True)
+class _OpenAISettings:
+    api_key: str
+    model: str
+    api_base: str
+    max_tokens: int
+    stream: bool
+    near_duplicate_cache: bool
+    max_rpm: int
+    cache_ttl_seconds: float
+    cache_max_entries: int
+    batch_poll_seconds: float
+    batch_max_wait_seconds: float
+
+
+@lru_cache(maxsize=1)
+def _openai_settings() -> _OpenAISettings:
+    """Read the OpenAI env vars once per process (call ``_openai_settings.cache_clear()`` after changing them)."""
+    return _OpenAISettings(
+        api_key=os.getenv("OPENAI_API_KEY", "").strip(),
+        model=os.getenv("OPENAI_MODEL", AI_DEFAULT_MODEL).strip() or AI_DEFAULT_MODEL,
+        api_base=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/"),
+        max_tokens=max(1, _env_int("OPENAI_MAX_TOKENS", AI_DEFAULT_MAX_TOKENS)),
+        stream=os.getenv("OPENAI_STREAM", "0") == "1",
+        near_duplicate_cache=os.getenv("OPENAI_NEAR_DUPLICATE_CACHE", "0") == "1",
+        max_rpm=_env_int("OPENAI_MAX_RPM", 0),
+        cache_ttl_seconds=_env_float("OPENAI_CACHE_TTL_SECONDS", 86400.0),
+        cache_max_entries=_env_int("OPENAI_CACHE_MAX_ENTRIES", 500),
+        batch_poll_seconds=max(1.0, _env_float("OPENAI_BATCH_POLL_SECONDS", 30.0)),
+        batch_max_wait_seconds=max(0.0, _env_float("OPENAI_BATCH_MAX_WAIT_SECONDS", 3600.0)),
+    )
+
+
+def _env_int(name: str, default: int) -> int:
+    # A typo in .env falls back to the default instead of aborting the deep dive.
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        LOGGER.warning("Ignoring invalid %s=%r; using %s", name, raw, default)
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        LOGGER.warning("Ignoring invalid %s=%r; using %s", name, raw, default)
+        return default
+
+
+def _openai_headers(api_key: str) -> dict[str, str]:
+    return {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
 
-    try:
-        response = requests.post(endpoint, headers=headers, json=body, timeout=AI_TIMEOUT_SECONDS)
-        response.raise_for_status()
-        payload = response.json()
-    except (requests.RequestException, ValueError):
-        return None
 
+def _parse_llm_content(
+    content: object,
+    candidate: Candidate,
+    news_items: list[NewsItem],
+    *,
+    peer_ranks: _PeerRanks,
+) -> _AIEvaluation | None:
     try:
-        content = payload["choices"][0]["message"]["content"]
-        model_result = json.loads(content)
-    except (KeyError, IndexError, TypeError, ValueError, json.JSONDecodeError):
+        model_result = _loads(content)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(model_result, dict):
         return None
 
     axis_scores = model_result.get("axis_scores", {})
     score_values = []
-    for key in (
-        "valuation_attractiveness",
-        "financial_quality",
-        "catalyst_strength",
-        "downside_risk_control",
-        "evidence_quality",
-    ):
+    for key in _AXIS_KEYS:
         raw = axis_scores.get(key)
         if isinstance(raw, (int, float)):
             score_values.append(float(raw))
@@ -237,7 +740,7 @@ def _evaluate_with_llm(
     total_score = max(0.0, min(100.0, float(total_score)))
 
     decision = str(model_result.get("decision", "")).strip()
-    if decision not in {"Recommend", "Watch", "Skip"}:
+    if decision not in _VALID_DECISIONS:
         decision = _decision_from_score(total_score)
 
     business_overview = _normalize_business_overview(
@@ -256,22 +759,29 @@ def _evaluate_with_llm(
     break_scenarios = _clip_text_list(model_result.get("break_scenarios"), 3)
     reevaluation_triggers = _clip_text_list(model_result.get("reevaluation_triggers"), 3)
 
+    axis = axis_scores.get
     score_headline = (
         f"AI総合点 {total_score:.1f}/100 "
-        f"(Valuation {axis_scores.get('valuation_attractiveness', 'N/A')}, "
-        f"Financial {axis_scores.get('financial_quality', 'N/A')}, "
-        f"Catalyst {axis_scores.get('catalyst_strength', 'N/A')}, "
-        f"Risk {axis_scores.get('downside_risk_control', 'N/A')}, "
-        f"Evidence {axis_scores.get('evidence_quality', 'N/A')})"
+        f"(Valuation {axis('valuation_attractiveness', 'N/A')}, "
+        f"Financial {axis('financial_quality', 'N/A')}, "
+        f"Catalyst {axis('catalyst_strength', 'N/A')}, "
+        f"Risk {axis('downside_risk_control', 'N/A')}, "
+        f"Evidence {axis('evidence_quality', 'N/A')})"
     )
-    reasons = [score_headline] + reasons
+    reasons = [score_headline, *reasons]
 
     reasons = _sanitize_specific_list(reasons, 3, _build_reason_fallback(candidate, total_score))
-    risks = _sanitize_specific_list(risks, 3, _build_specific_risk_fallback(candidate, news_items))
+    negative_headlines = _extract_negative_headlines(news_items)
+    risks = _sanitize_specific_list(
+        risks,
+        3,
+        _build_specific_risk_fallback(candidate, news_items, negative_headlines=negative_headlines),
+    )
     assumptions = _sanitize_specific_list(assumptions, 3, _build_specific_assumption_fallback(candidate))
+    inferred_trends = _infer_industry_trends(candidate, news_items)
     if not industry_trends:
-        industry_trends = _infer_industry_trends(candidate, news_items)
-    fallback_strengths, fallback_weaknesses = _infer_peer_strengths_weaknesses(candidate, peer_candidates)
+        industry_trends = inferred_trends
+    fallback_strengths, fallback_weaknesses = peer_ranks.strengths_weaknesses(candidate)
     if not peer_strengths:
         peer_strengths = fallback_strengths
     if not peer_weaknesses:
@@ -279,7 +789,7 @@ def _evaluate_with_llm(
     industry_trends = _sanitize_specific_list(
         industry_trends,
         3,
-        _infer_industry_trends(candidate, news_items),
+        inferred_trends,
     )
     peer_strengths = _sanitize_specific_list(
         peer_strengths,
@@ -291,19 +801,21 @@ def _evaluate_with_llm(
         3,
         fallback_weaknesses,
     )
+    inferred_causes = _infer_lag_causes(candidate, negative_headlines=negative_headlines)
+    inferred_views = _infer_critical_views(candidate, news_items, decision, negative_headlines=negative_headlines)
     if not lag_causes:
-        lag_causes = _infer_lag_causes(candidate, news_items)
+        lag_causes = inferred_causes
     if not critical_views:
-        critical_views = _infer_critical_views(candidate, news_items, decision)
+        critical_views = inferred_views
     lag_causes = _sanitize_specific_list(
         lag_causes,
         3,
-        _build_specific_lag_cause_fallback(candidate, news_items),
+        _build_specific_lag_cause_fallback(candidate, inferred_causes),
     )
     critical_views = _sanitize_specific_list(
         critical_views,
         3,
-        _build_specific_critical_view_fallback(candidate, news_items, decision),
+        _build_specific_critical_view_fallback(candidate, inferred_views),
     )
     break_scenarios = _sanitize_specific_list(
         break_scenarios,
@@ -320,23 +832,51 @@ def _evaluate_with_llm(
         total_score=total_score,
         decision=decision,
         business_overview=business_overview,
-        reasons=reasons[:3],
-        risks=risks[:3],
-        assumptions=assumptions[:3],
-        industry_trends=industry_trends[:3],
-        peer_strengths=peer_strengths[:3],
-        peer_weaknesses=peer_weaknesses[:3],
-        lag_causes=lag_causes[:3],
-        critical_views=critical_views[:3],
-        break_scenarios=break_scenarios[:3],
-        reevaluation_triggers=reevaluation_triggers[:3],
+        # Every list already went through _sanitize_specific_list(..., 3, ...), which enforces the limit.
+        reasons=reasons,
+        risks=risks,
+        assumptions=assumptions,
+        industry_trends=industry_trends,
+        peer_strengths=peer_strengths,
+        peer_weaknesses=peer_weaknesses,
+        lag_causes=lag_causes,
+        critical_views=critical_views,
+        break_scenarios=break_scenarios,
+        reevaluation_triggers=reevaluation_triggers,
     )
 
+def _wait_for_rate_limit() -> None:
+    global _next_request_at
+    max_rpm = _openai_settings().max_rpm
+    if max_rpm <= 0:
+        return
+    with _RATE_LOCK:
+        now = time.monotonic()
+        start_at = max(now, _next_request_at)
+        _next_request_at = start_at + 60.0 / max_rpm
+    if start_at > now:
+        time.sleep(start_at - now)
+
+
+def _dumps(obj: object) -> bytes:
+    # Compact UTF-8 JSON; orjson and the stdlib fallback produce the same bytes for prompt payloads.
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: str | bytes) -> Any:
+    # Both decoders raise ValueError subclasses on malformed input.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _fallback_evaluation(
     candidate: Candidate,
     news_items: list[NewsItem],
     *,
-    peer_candidates: list[Candidate],
+    peer_ranks: _PeerRanks,
 ) -> _AIEvaluation:
     qual_100 = candidate.qualitative_score_normalized
     total_score = (candidate.quantitative_score * 0.8) + (qual_100 * 0.2)
@@ -347,12 +887,13 @@ def _fallback_evaluation(
         f"定量総合点 {candidate.quantitative_score:.1f} / 定性換算 {qual_100:.1f}",
         f"参照ニュース件数 {len(news_items)}件",
     ]
-    risks = _build_specific_risk_fallback(candidate, news_items)
+    negative_headlines = _extract_negative_headlines(news_items)
+    risks = _build_specific_risk_fallback(candidate, news_items, negative_headlines=negative_headlines)
     assumptions = _build_specific_assumption_fallback(candidate)
     industry_trends = _infer_industry_trends(candidate, news_items)
-    peer_strengths, peer_weaknesses = _infer_peer_strengths_weaknesses(candidate, peer_candidates)
-    lag_causes = _infer_lag_causes(candidate, news_items)
-    critical_views = _infer_critical_views(candidate, news_items, decision)
+    peer_strengths, peer_weaknesses = peer_ranks.strengths_weaknesses(candidate)
+    lag_causes = _infer_lag_causes(candidate, negative_headlines=negative_headlines)
+    critical_views = _infer_critical_views(candidate, news_items, decision, negative_headlines=negative_headlines)
     break_scenarios = _build_specific_break_scenarios(candidate)
     reevaluation_triggers = _build_specific_reevaluation_triggers(candidate)
     return _AIEvaluation(
@@ -383,57 +924,35 @@ def _decision_from_score(score: float) -> str:
 def _clip_text_list(value: object, limit: int) -> list[str]:
     if not isinstance(value, list):
         return []
-    out: list[str] = []
-    for item in value:
-        text = str(item).strip()
-        if text:
-            out.append(text)
-        if len(out) >= limit:
-            break
-    return out
+    # islice stops pulling once limit non-empty items are found, like the former early break.
+    return list(islice(filter(None, (str(item).strip() for item in value)), limit))
 
 
 def _build_source_links(items: list[NewsItem]) -> list[str]:
-    links = []
-    for item in items[:5]:
-        links.append(f"{item.title} | {item.source} | {item.published_at} | {item.url}")
-    return links
+    return [f"{item.title} | {item.source} | {item.published_at} | {item.url}" for item in items[:5]]
 
 
 def _dedupe_by_url(items: list[NewsItem]) -> list[NewsItem]:
-    deduped: list[NewsItem] = []
-    seen_urls: set[str] = set()
+    # One insertion-ordered dict replaces the set + list pair; setdefault keeps the first item per URL.
+    by_url: dict[str, NewsItem] = {}
+    setdefault = by_url.setdefault
     for item in items:
-        if not item.url or item.url in seen_urls:
-            continue
-        seen_urls.add(item.url)
-        deduped.append(item)
-    return deduped
-
-
-def _build_peer_snapshot(candidate: Candidate, peer_candidates: list[Candidate]) -> dict[str, object]:
-    strengths, weaknesses = _infer_peer_strengths_weaknesses(candidate, peer_candidates)
-    metric_snapshot = {}
-    for metric_id in (
-        "pbr",
-        "per",
-        "dividend_yield",
-        "roe",
-        "equity_ratio",
-        "net_de_ratio",
-        "revenue_cagr_3y",
-        "op_income_cagr_3y",
-    ):
-        rank_info = _metric_peer_rank(candidate, peer_candidates, metric_id, higher_is_better=(metric_id not in {"pbr", "per", "net_de_ratio"}))
-        if rank_info is None:
-            continue
-        rank, n = rank_info
-        metric_snapshot[metric_id] = {"rank": rank, "peer_count": n}
+        url = item.url
+        if url:
+            setdefault(url, item)
+    return list(by_url.values())
+
+
+def _build_peer_snapshot(candidate: Candidate, peer_ranks: _PeerRanks) -> dict[str, object]:
+    metric_ranks = peer_ranks.metric_ranks(candidate)
+    strengths, weaknesses = peer_ranks.strengths_weaknesses(candidate)
     return {
         "sector": candidate.sector,
         "strengths": strengths[:3],
         "weaknesses": weaknesses[:3],
-        "metric_ranks": metric_snapshot,
+        "metric_ranks": {
+            metric_id: {"rank": rank, "peer_count": n} for metric_id, (rank, n) in metric_ranks.items()
+        },
     }
 
 
@@ -444,16 +963,12 @@ def _infer_industry_trends(candidate: Candidate, news_items: list[NewsItem]) ->
             f"{sector_name}の景気動向を評価するニュース件数が不足している",
         ]
 
-    positive_kw = ("需要", "回復", "増", "改善", "上方", "拡大", "好調", "追い風")
-    negative_kw = ("減速", "悪化", "下方", "停滞", "逆風", "不透明", "事故", "訴訟", "減益")
     positive_count = 0
     negative_count = 0
     for item in news_items:
-        title = item.title
-        if any(k in title for k in positive_kw):
-            positive_count += 1
-        if any(k in title for k in negative_kw):
-            negative_count += 1
+        is_positive, is_negative, _ = _title_keyword_hits(item.title)
+        positive_count += is_positive
+        negative_count += is_negative
 
     trends: list[str] = []
     if positive_count > negative_count:
@@ -471,25 +986,24 @@ def _infer_industry_trends(candidate: Candidate, news_items: list[NewsItem]) ->
     return trends[:3]
 
 
-def _infer_peer_strengths_weaknesses(candidate: Candidate, peer_candidates: list[Candidate]) -> tuple[list[str], list[str]]:
-    metric_defs = [
-        ("pbr", "PBR", False),
-        ("per", "PER", False),
-        ("dividend_yield", "配当利回り", True),
-        ("roe", "ROE", True),
-        ("equity_ratio", "自己資本比率", True),
-        ("net_de_ratio", "ネットD/E", False),
-        ("revenue_cagr_3y", "売上高変化率", True),
-        ("op_income_cagr_3y", "経常利益変化率", True),
-    ]
+_PEER_METRICS: tuple[tuple[str, str, bool], ...] = (
+    ("pbr", "PBR", False),
+    ("per", "PER", False),
+    ("dividend_yield", "配当利回り", True),
+    ("roe", "ROE", True),
+    ("equity_ratio", "自己資本比率", True),
+    ("net_de_ratio", "ネットD/E", False),
+    ("revenue_cagr_3y", "売上高変化率", True),
+    ("op_income_cagr_3y", "経常利益変化率", True),
+)
+_PEER_METRIC_LABELS = {metric_id: label for metric_id, label, _ in _PEER_METRICS}
 
+
+def _infer_peer_strengths_weaknesses(metric_ranks: dict[str, tuple[int, int]]) -> tuple[list[str], list[str]]:
     strengths: list[str] = []
     weaknesses: list[str] = []
-    for metric_id, label, higher_is_better in metric_defs:
-        rank_info = _metric_peer_rank(candidate, peer_candidates, metric_id, higher_is_better=higher_is_better)
-        if rank_info is None:
-            continue
-        rank, n = rank_info
+    for metric_id, (rank, n) in metric_ranks.items():
+        label = _PEER_METRIC_LABELS[metric_id]
         bucket = max(1, (n + 2) // 3)
         if rank <= bucket:
             strengths.append(f"{label}が同業{n}社中で上位（{rank}位）")
@@ -503,14 +1017,77 @@ def _infer_peer_strengths_weaknesses(candidate: Candidate, peer_candidates: list
     return strengths[:3], weaknesses[:3]
 
 
-def _metric_peer_rank(
-    candidate: Candidate,
-    peer_candidates: list[Candidate],
+class _PeerRanks:
+    """Peer-relative metric ranks, sorted once per (peer group, metric) and shared by all candidates."""
+
+    def __init__(self, peers: list[Candidate]) -> None:
+        self._peers = peers
+        self._by_sector: dict[str, list[Candidate]] = {}
+        for peer in peers:
+            self._by_sector.setdefault(peer.sector, []).append(peer)
+        self._lock = threading.Lock()
+        self._ranks: dict[tuple[str | None, str, bool], tuple[dict[str, int], int] | None] = {}
+        self._by_candidate: dict[str, dict[str, tuple[int, int]]] = {}
+        self._summaries: dict[str, tuple[list[str], list[str]]] = {}
+        self._snapshots: dict[str, dict[str, object]] = {}
+
+    def snapshot(self, candidate: Candidate) -> dict[str, object]:
+        """Prompt-ready peer snapshot for a candidate, built once however many prompts include it."""
+        snapshot = self._snapshots.get(candidate.ticker)
+        if snapshot is None:
+            snapshot = _build_peer_snapshot(candidate, self)
+            self._snapshots[candidate.ticker] = snapshot
+        return snapshot
+
+    def strengths_weaknesses(self, candidate: Candidate) -> tuple[list[str], list[str]]:
+        """Peer strengths/weaknesses for a candidate, derived once and shared by the prompt and fallbacks."""
+        summary = self._summaries.get(candidate.ticker)
+        if summary is None:
+            summary = _infer_peer_strengths_weaknesses(self.metric_ranks(candidate))
+            self._summaries[candidate.ticker] = summary
+        return summary
+
+    def metric_ranks(self, candidate: Candidate) -> dict[str, tuple[int, int]]:
+        """Return {metric_id: (rank, peer_count)} for every ranked peer metric, in _PEER_METRICS order."""
+        cached = self._by_candidate.get(candidate.ticker)
+        if cached is not None:
+            return cached
+        ranks: dict[str, tuple[int, int]] = {}
+        for metric_id, _, higher_is_better in _PEER_METRICS:
+            rank_info = self.rank(candidate, metric_id, higher_is_better=higher_is_better)
+            if rank_info is not None:
+                ranks[metric_id] = rank_info
+        self._by_candidate[candidate.ticker] = ranks
+        return ranks
+
+    def rank(self, candidate: Candidate, metric_id: str, *, higher_is_better: bool) -> tuple[int, int] | None:
+        same_sector = self._by_sector.get(candidate.sector, [])
+        group_key = candidate.sector if len(same_sector) >= 3 else None
+        key = (group_key, metric_id, higher_is_better)
+        with self._lock:
+            table = self._ranks.get(key, _MISSING)
+            if table is _MISSING:
+                peers = same_sector if group_key is not None else self._peers
+                table = _rank_table(peers, metric_id, higher_is_better=higher_is_better)
+                self._ranks[key] = table
+        if table is None:
+            return None
+        positions, total = table
+        position = positions.get(candidate.ticker)
+        if position is None:
+            return None
+        return position, total
+
+
+_MISSING: Any = object()
+
+
+def _rank_table(
+    peers: list[Candidate],
     metric_id: str,
     *,
     higher_is_better: bool,
-) -> tuple[int, int] | None:
-    peers = _peer_group(candidate, peer_candidates)
+) -> tuple[dict[str, int], int] | None:
     values: list[tuple[str, float]] = []
     for peer in peers:
         value = _metric(peer.quantitative_metrics, metric_id)
@@ -520,21 +1097,14 @@ def _metric_peer_rank(
 
     if len(values) < 3:
         return None
-    sorted_values = sorted(values, key=lambda x: x[1], reverse=higher_is_better)
+    sorted_values = sorted(values, key=itemgetter(1), reverse=higher_is_better)
+    positions: dict[str, int] = {}
     for idx, (ticker, _) in enumerate(sorted_values, start=1):
-        if ticker == candidate.ticker:
-            return idx, len(sorted_values)
-    return None
-
+        positions.setdefault(ticker, idx)
+    return positions, len(sorted_values)
 
-def _peer_group(candidate: Candidate, peers: list[Candidate]) -> list[Candidate]:
-    same_sector = [peer for peer in peers if peer.sector == candidate.sector]
-    if len(same_sector) >= 3:
-        return same_sector
-    return peers
 
-
-def _infer_lag_causes(candidate: Candidate, news_items: list[NewsItem]) -> list[str]:
+def _infer_lag_causes(candidate: Candidate, *, negative_headlines: list[str]) -> list[str]:
     metrics = candidate.quantitative_metrics
     causes: list[str] = []
 
@@ -556,34 +1126,43 @@ def _infer_lag_causes(candidate: Candidate, news_items: list[NewsItem]) -> list[
     if de_ratio is not None and de_ratio > 80.0:
         causes.append("財務レバレッジへの懸念がバリュエーションを抑制している")
 
-    negative_heads = _extract_negative_headlines(news_items)
-    if negative_heads:
-        causes.append(f"直近でネガティブ材料（例: {negative_heads[0]}）が意識されている")
+    if negative_headlines:
+        causes.append(f"直近でネガティブ材料（例: {negative_headlines[0]}）が意識されている")
     if not causes:
         causes.append("材料不足により評価見直しのトリガーが不明確")
     return causes[:3]
 
 
-def _infer_critical_views(candidate: Candidate, news_items: list[NewsItem], decision: str) -> list[str]:
+def _infer_critical_views(
+    candidate: Candidate,
+    news_items: list[NewsItem],
+    decision: str,
+    *,
+    negative_headlines: list[str],
+) -> list[str]:
     metrics = candidate.quantitative_metrics
     views: list[str] = []
 
     if decision == "Recommend":
         views.append("割安指標はバリュートラップであり、再評価が起きない可能性がある")
 
-    if _metric(metrics, "op_income_cagr_3y") is not None and _metric(metrics, "op_income_cagr_3y") < 0.0:
+    op_income = _metric(metrics, "op_income_cagr_3y")
+    revenue = _metric(metrics, "revenue_cagr_3y")
+    de_ratio = _metric(metrics, "net_de_ratio")
+
+    if op_income is not None and op_income < 0.0:
         views.append("利益成長がマイナスで、投資判断が早計である可能性がある")
-    if _metric(metrics, "revenue_cagr_3y") is not None and _metric(metrics, "revenue_cagr_3y") < 0.0:
+    if revenue is not None and revenue < 0.0:
         views.append("売上が縮小トレンドで、中長期の成長前提が崩れる可能性がある")
-    if _metric(metrics, "net_de_ratio") is not None and _metric(metrics, "net_de_ratio") > 100.0:
+    if de_ratio is not None and de_ratio > 100.0:
         views.append("負債負担が重く、景気後退局面で下振れ余地が大きい")
     if not news_items:
         views.append("ニュース根拠が限定的で、現時点の判断確度は十分ではない")
-    elif _extract_negative_headlines(news_items):
+    elif negative_headlines:
         views.append("直近ニュースにネガティブ事象が含まれ、想定以上の下方リスクがある")
 
     if not views:
-        growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+        growth = _metric(metrics, "revenue_growth_forecast") or revenue
         per = _metric(metrics, "per")
         if growth is not None and per is not None and growth > 0:
             views.append(
@@ -595,17 +1174,35 @@ def _infer_critical_views(candidate: Candidate, news_items: list[NewsItem], deci
 
 
 def _extract_negative_headlines(news_items: list[NewsItem]) -> list[str]:
-    keywords = ("減益", "下方修正", "事故", "訴訟", "不祥事", "赤字", "業績悪化", "減配")
     found: list[str] = []
     for item in news_items:
         title = item.title
-        if any(k in title for k in keywords):
+        if _title_keyword_hits(title)[2]:
             found.append(title)
         if len(found) >= 3:
             break
     return found
 
 
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_TREND_POSITIVE_RE = _keyword_pattern(("需要", "回復", "増", "改善", "上方", "拡大", "好調", "追い風"))
+_TREND_NEGATIVE_RE = _keyword_pattern(("減速", "悪化", "下方", "停滞", "逆風", "不透明", "事故", "訴訟", "減益"))
+_NEGATIVE_HEADLINE_RE = _keyword_pattern(("減益", "下方修正", "事故", "訴訟", "不祥事", "赤字", "業績悪化", "減配"))
+
+
+@lru_cache(maxsize=4096)
+def _title_keyword_hits(title: str) -> tuple[bool, bool, bool]:
+    """Return (positive trend, negative trend, negative headline) keyword hits for a news title."""
+    return (
+        _TREND_POSITIVE_RE.search(title) is not None,
+        _TREND_NEGATIVE_RE.search(title) is not None,
+        _NEGATIVE_HEADLINE_RE.search(title) is not None,
+    )
+
+
 def _metric(metrics: dict[str, float], key: str) -> float | None:
     value = metrics.get(key)
     if isinstance(value, (int, float)):
@@ -613,6 +1210,11 @@ def _metric(metrics: dict[str, float], key: str) -> float | None:
     return None
 
 
+def _revenue_growth(metrics: dict[str, float]) -> float | None:
+    # Forecast growth when available (and non-zero), otherwise the 3-year CAGR.
+    return _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+
+
 _GENERIC_PATTERNS = (
     "業績が予想を上回る場合",
     "再評価の可能性",
@@ -622,18 +1224,24 @@ _GENERIC_PATTERNS = (
     "短期材料の変化により判断が変わる可能性",
     "前提条件が変化した場合",
     "前提条件を更新すること",
-    "市場全体の景気後退",
     "業界全体の景気回復",
     "競争が激化",
     "新規事業の成功",
 )
+_WS_RE = re.compile(r"\s+")
+_DIGIT_RE = re.compile(r"\d")
+_GENERIC_RE = _keyword_pattern(_GENERIC_PATTERNS)
+_HEDGE_EVIDENCE_RE = _keyword_pattern(("売上", "利益", "PER", "ROE", "負債", "決算", "開示", "案件"))
+_EVIDENCE_MARKERS = ("売上", "営業利益率", "経常利益", "PER", "ROE", "自己資本比率", "有利子負債", "下方修正", "上方修正", "自社株買い", "決算")
+_GENERIC_EVIDENCE_RE = _keyword_pattern(_EVIDENCE_MARKERS)
+_BROAD_MARKET_RE = _keyword_pattern(("市場全体", "業界全体", "競争", "景気", "成長"))
+_SPECIFIC_EVIDENCE_RE = _keyword_pattern((*_EVIDENCE_MARKERS, "開示", "受注", "案件", "保有割合", "配当", "シェア"))
 
 
 def _sanitize_specific_list(items: list[str], limit: int, fallback: list[str]) -> list[str]:
-    merged = [*items, *fallback]
     out: list[str] = []
     seen: set[str] = set()
-    for item in merged:
+    for item in chain(items, fallback):
         text = str(item).strip()
         if not text or text in seen:
             continue
@@ -645,54 +1253,29 @@ def _sanitize_specific_list(items: list[str], limit: int, fallback: list[str]) -
         seen.add(text)
         if len(out) >= limit:
             break
-    return out[:limit]
+    return out
 
 
 def _is_too_generic_statement(text: str) -> bool:
-    compact = re.sub(r"\s+", "", text)
-    if any(pattern in compact for pattern in _GENERIC_PATTERNS):
+    compact = _WS_RE.sub("", text)
+    if _GENERIC_RE.search(compact):
+        return True
+    if _DIGIT_RE.search(compact):
+        return False
+    if "可能性" in compact and not _HEDGE_EVIDENCE_RE.search(compact):
         return True
-    if "可能性" in compact and not re.search(r"\d", compact):
-        if all(marker not in compact for marker in ("売上", "利益", "PER", "ROE", "負債", "決算", "開示", "案件")):
-            return True
-    if not re.search(r"\d", compact):
-        evidence_markers = ("売上", "営業利益率", "経常利益", "PER", "ROE", "自己資本比率", "有利子負債", "下方修正", "上方修正", "自社株買い", "決算")
-        if all(marker not in compact for marker in evidence_markers):
-            if any(marker in compact for marker in ("市場全体", "業界全体", "競争", "景気", "成長")):
-                return True
-    return False
+    return not _GENERIC_EVIDENCE_RE.search(compact) and _BROAD_MARKET_RE.search(compact) is not None
 
 
 def _has_specific_evidence(text: str) -> bool:
-    compact = re.sub(r"\s+", "", text)
-    if re.search(r"\d", compact):
-        return True
-    evidence_markers = (
-        "売上",
-        "営業利益率",
-        "経常利益",
-        "PER",
-        "ROE",
-        "自己資本比率",
-        "有利子負債",
-        "決算",
-        "開示",
-        "下方修正",
-        "上方修正",
-        "自社株買い",
-        "受注",
-        "案件",
-        "保有割合",
-        "配当",
-        "シェア",
-    )
-    return any(marker in compact for marker in evidence_markers)
+    compact = _WS_RE.sub("", text)
+    return _DIGIT_RE.search(compact) is not None or _SPECIFIC_EVIDENCE_RE.search(compact) is not None
 
 
 def _build_reason_fallback(candidate: Candidate, total_score: float) -> list[str]:
     metrics = candidate.quantitative_metrics
     reasons: list[str] = [f"AI総合点 {total_score:.1f}/100（数値根拠ベース）"]
-    growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+    growth = _revenue_growth(metrics)
     op_margin = _metric(metrics, "operating_margin")
     per = _metric(metrics, "per")
 
@@ -705,10 +1288,15 @@ def _build_reason_fallback(candidate: Candidate, total_score: float) -> list[str
     return reasons[:3]
 
 
-def _build_specific_risk_fallback(candidate: Candidate, news_items: list[NewsItem]) -> list[str]:
+def _build_specific_risk_fallback(
+    candidate: Candidate,
+    news_items: list[NewsItem],
+    *,
+    negative_headlines: list[str],
+) -> list[str]:
     metrics = candidate.quantitative_metrics
     risks: list[str] = []
-    growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+    growth = _revenue_growth(metrics)
     per = _metric(metrics, "per")
     de_ratio = _metric(metrics, "net_de_ratio")
     op_margin = _metric(metrics, "operating_margin")
@@ -720,9 +1308,8 @@ def _build_specific_risk_fallback(candidate: Candidate, news_items: list[NewsIte
     if op_margin is not None and op_margin < 10.0:
         risks.append(f"売上高営業利益率 {op_margin:.1f}% と低く、成長鈍化時の利益下振れ耐性が弱い")
 
-    negative = _extract_negative_headlines(news_items)
-    if negative:
-        risks.append(f"直近ネガティブ材料: {negative[0]}")
+    if negative_headlines:
+        risks.append(f"直近ネガティブ材料: {negative_headlines[0]}")
 
     if not risks:
         risks.append(f"参照ニュース件数 {len(news_items)}件で、事業進捗の検証材料が少ない")
@@ -732,7 +1319,7 @@ def _build_specific_risk_fallback(candidate: Candidate, news_items: list[NewsIte
 def _build_specific_assumption_fallback(candidate: Candidate) -> list[str]:
     metrics = candidate.quantitative_metrics
     assumptions: list[str] = []
-    growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+    growth = _revenue_growth(metrics)
     op_margin = _metric(metrics, "operating_margin")
     de_ratio = _metric(metrics, "net_de_ratio")
 
@@ -750,7 +1337,7 @@ def _build_specific_assumption_fallback(candidate: Candidate) -> list[str]:
 def _build_specific_break_scenarios(candidate: Candidate) -> list[str]:
     metrics = candidate.quantitative_metrics
     scenarios: list[str] = []
-    growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+    growth = _revenue_growth(metrics)
     op_margin = _metric(metrics, "operating_margin")
     de_ratio = _metric(metrics, "net_de_ratio")
 
@@ -768,7 +1355,7 @@ def _build_specific_break_scenarios(candidate: Candidate) -> list[str]:
 def _build_specific_reevaluation_triggers(candidate: Candidate) -> list[str]:
     metrics = candidate.quantitative_metrics
     triggers: list[str] = []
-    growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+    growth = _revenue_growth(metrics)
     profit_growth = _metric(metrics, "op_income_growth_forecast") or _metric(metrics, "op_income_cagr_3y")
     op_margin = _metric(metrics, "operating_margin")
 
@@ -783,28 +1370,22 @@ def _build_specific_reevaluation_triggers(candidate: Candidate) -> list[str]:
     return triggers[:3]
 
 
-def _build_specific_lag_cause_fallback(candidate: Candidate, news_items: list[NewsItem]) -> list[str]:
-    causes = _infer_lag_causes(candidate, news_items)
-    if causes:
-        return causes
+def _build_specific_lag_cause_fallback(candidate: Candidate, inferred_causes: list[str]) -> list[str]:
+    if inferred_causes:
+        return inferred_causes
     metrics = candidate.quantitative_metrics
     per = _metric(metrics, "per")
-    growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+    growth = _revenue_growth(metrics)
     if per is not None and growth is not None:
         return [f"PER {per:.1f}倍に対して売上成長率 {growth:.1f}% で、評価の上振れ余地が限定的"]
     return ["直近開示で評価を押し上げる定量材料が不足"]
 
 
-def _build_specific_critical_view_fallback(
-    candidate: Candidate,
-    news_items: list[NewsItem],
-    decision: str,
-) -> list[str]:
-    views = _infer_critical_views(candidate, news_items, decision)
-    if views:
-        return views
+def _build_specific_critical_view_fallback(candidate: Candidate, inferred_views: list[str]) -> list[str]:
+    if inferred_views:
+        return inferred_views
     metrics = candidate.quantitative_metrics
-    growth = _metric(metrics, "revenue_growth_forecast") or _metric(metrics, "revenue_cagr_3y")
+    growth = _revenue_growth(metrics)
     op_margin = _metric(metrics, "operating_margin")
     if growth is not None and op_margin is not None:
         return [f"売上成長率 {growth:.1f}% と営業利益率 {op_margin:.1f}% が同時に鈍化すると判断前提が崩れる"]
@@ -815,7 +1396,7 @@ def _normalize_business_overview(raw: object, candidate: Candidate, news_items:
     text = str(raw).strip() if raw is not None else ""
     if not text or _is_too_generic_statement(text):
         return _fallback_business_overview(candidate, news_items)
-    compact = re.sub(r"\s+", " ", text)
+    compact = _WS_RE.sub(" ", text)
     return compact[:60]
 
 
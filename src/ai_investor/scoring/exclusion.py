@@ -8,4 +8,4 @@ def apply_exclusion_rules(candidates: list[Candidate], rules: list[dict]) -> Non
     _ = rules
     for candidate in candidates:
         candidate.excluded = False
-        candidate.exclusion_reasons = []
+        candidate.exclusion_reasons = ()
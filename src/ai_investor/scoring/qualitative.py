@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from typing import Any
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Any, Callable
 
 from ai_investor.models import Candidate
 
+# Threshold tuples shared by more than one axis; the rest are inline tuple constants.
+_ROE_THRESHOLDS: tuple[float, ...] = (5.0, 8.0, 12.0, 16.0)
+_OP_INCOME_CAGR_THRESHOLDS: tuple[float, ...] = (0.0, 5.0, 10.0, 15.0)
+_EQUITY_RATIO_THRESHOLDS: tuple[float, ...] = (25.0, 35.0, 45.0, 60.0)
+_NET_DE_RATIO_THRESHOLDS: tuple[float, ...] = (30.0, 60.0, 100.0, 150.0)
+_DE_RATIO_THRESHOLDS: tuple[float, ...] = (20.0, 40.0, 70.0, 100.0)
+
 
 def score_candidates(
     candidates: list[Candidate],
@@ -15,12 +24,14 @@ def score_candidates(
     axis_defs = _normalize_axes(axes)
     total_weight = sum(weight for _, weight in axis_defs) or 1.0
     max_score = total_weight * float(scale_max)
+    axis_scorers = [(axis_id, weight, _AXIS_SCORERS.get(axis_id, _score_unknown_axis)) for axis_id, weight in axis_defs]
 
     for candidate in candidates:
+        metrics = _numeric_metrics(candidate.quantitative_metrics)
         axis_scores: dict[str, float] = {}
         weighted_total = 0.0
-        for axis_id, weight in axis_defs:
-            axis_score = _score_axis(candidate, axis_id)
+        for axis_id, weight, scorer in axis_scorers:
+            axis_score = scorer(metrics)
             axis_scores[axis_id] = axis_score
             weighted_total += axis_score * weight
 
@@ -30,184 +41,235 @@ def score_candidates(
         candidate.qualitative_score_normalized = _to_100(weighted_total, max_score)
 
 
-def _normalize_axes(axes: list[dict[str, Any]]) -> list[tuple[str, float]]:
+def _normalize_axes(axes: list[dict[str, Any]]) -> tuple[tuple[str, float], ...]:
     if not axes:
-        return []
+        return ()
+    axes_key = tuple((str(axis.get("id", "")), axis.get("weight", 1.0)) for axis in axes)
+    try:
+        return _normalize_axes_cached(axes_key)
+    except TypeError:
+        # An unhashable weight from YAML (e.g. a list) cannot be a cache key; it falls back to 1.0 anyway.
+        return _normalize_axes_cached.__wrapped__(axes_key)
+
+
+@lru_cache(maxsize=8)
+def _normalize_axes_cached(axes_key: tuple[tuple[str, Any], ...]) -> tuple[tuple[str, float], ...]:
     normalized: list[tuple[str, float]] = []
-    for axis in axes:
-        axis_id = str(axis.get("id", "")).strip()
+    for raw_id, raw_weight in axes_key:
+        axis_id = raw_id.strip()
         if not axis_id:
             continue
-        raw_weight = axis.get("weight", 1.0)
         weight = float(raw_weight) if isinstance(raw_weight, (int, float)) else 1.0
         if weight <= 0:
             continue
         normalized.append((axis_id, weight))
-    return normalized
+    return tuple(normalized)
 
 
-def _score_axis(candidate: Candidate, axis_id: str) -> float:
-    metrics = candidate.quantitative_metrics
+def _numeric_metrics(raw: dict[str, float]) -> dict[str, float]:
+    # Coerced once per candidate so the axis scorers only ever see floats or a missing key.
+    numeric: dict[str, float] = {}
+    for key, value in raw.items():
+        # Parsed metrics are almost always plain floats: an identity check skips isinstance's MRO walk and float().
+        if type(value) is float:
+            numeric[key] = value
+        elif isinstance(value, (int, float)):
+            numeric[key] = float(value)
+    return numeric
 
-    if axis_id == "temporary_lag_factor":
-        return _avg(
-            [
-                _lower_better_score(metrics.get("pbr"), [0.8, 1.0, 1.3, 1.8]),
-                _lower_better_score(metrics.get("per"), [8.0, 12.0, 16.0, 22.0]),
-                _higher_better_score(metrics.get("roe"), [5.0, 8.0, 12.0, 16.0]),
-            ]
-        )
 
-    if axis_id == "growth_driver_confidence":
-        return _avg(
-            [
-                _higher_better_score(metrics.get("revenue_cagr_3y"), [0.0, 3.0, 7.0, 12.0]),
-                _higher_better_score(metrics.get("op_income_cagr_3y"), [0.0, 5.0, 10.0, 15.0]),
-                _higher_better_score(metrics.get("roe"), [5.0, 8.0, 12.0, 16.0]),
-            ]
-        )
+def _score_unknown_axis(metrics: dict[str, float]) -> float:
+    return 2.5
 
-    if axis_id == "management_and_capital_policy":
-        return _avg(
-            [
-                _higher_better_score(metrics.get("dividend_yield"), [1.0, 2.0, 3.0, 4.0]),
-                _higher_better_score(metrics.get("equity_ratio"), [25.0, 35.0, 45.0, 60.0]),
-                _lower_better_score(metrics.get("net_de_ratio"), [30.0, 60.0, 100.0, 150.0]),
-            ]
-        )
 
-    if axis_id == "competitive_advantage":
-        return _avg(
-            [
-                _higher_better_score(metrics.get("roe"), [5.0, 8.0, 12.0, 16.0]),
-                _higher_better_score(metrics.get("op_income_cagr_3y"), [0.0, 5.0, 10.0, 15.0]),
-            ]
+def _score_temporary_lag_factor(metrics: dict[str, float]) -> float:
+    return round(
+        (
+            _lower_better_score(metrics.get("pbr"), (0.8, 1.0, 1.3, 1.8))
+            + _lower_better_score(metrics.get("per"), (8.0, 12.0, 16.0, 22.0))
+            + _higher_better_score(metrics.get("roe"), _ROE_THRESHOLDS)
         )
+        / 3,
+        2,
+    )
 
-    if axis_id == "risk_resilience":
-        return _avg(
-            [
-                _higher_better_score(metrics.get("equity_ratio"), [25.0, 35.0, 45.0, 60.0]),
-                _lower_better_score(metrics.get("net_de_ratio"), [30.0, 60.0, 100.0, 150.0]),
-            ]
-        )
 
-    if axis_id == "revenue_growth_strength":
-        growth_now = _metric(metrics, "revenue_growth_forecast")
-        growth_3y = _metric(metrics, "revenue_cagr_3y")
-        profit_growth = _metric(metrics, "op_income_growth_forecast")
-        return _avg(
-            [
-                _higher_better_score(growth_now, [5.0, 10.0, 15.0, 25.0]),
-                _higher_better_score(growth_3y, [5.0, 10.0, 15.0, 20.0]),
-                _higher_better_score(profit_growth, [5.0, 10.0, 20.0, 30.0]),
-            ]
+def _score_growth_driver_confidence(metrics: dict[str, float]) -> float:
+    return round(
+        (
+            _higher_better_score(metrics.get("revenue_cagr_3y"), (0.0, 3.0, 7.0, 12.0))
+            + _higher_better_score(metrics.get("op_income_cagr_3y"), _OP_INCOME_CAGR_THRESHOLDS)
+            + _higher_better_score(metrics.get("roe"), _ROE_THRESHOLDS)
         )
+        / 3,
+        2,
+    )
 
-    if axis_id == "tam_expansion_potential":
-        growth_now = _metric(metrics, "revenue_growth_forecast")
-        growth_3y = _metric(metrics, "revenue_cagr_3y")
-        market_cap = _metric(metrics, "market_cap_jpy")
-        return _avg(
-            [
-                _higher_better_score(growth_now, [10.0, 15.0, 20.0, 30.0]),
-                _higher_better_score(growth_3y, [8.0, 12.0, 16.0, 22.0]),
-                _tam_runway_score(market_cap),
-            ]
-        )
 
-    if axis_id == "profit_structure_improvement":
-        op_margin = _metric(metrics, "operating_margin")
-        profit_growth = _metric(metrics, "op_income_growth_forecast")
-        return _avg(
-            [
-                _higher_better_score(op_margin, [8.0, 12.0, 18.0, 25.0]),
-                _higher_better_score(profit_growth, [0.0, 10.0, 20.0, 35.0]),
-            ]
+def _score_management_and_capital_policy(metrics: dict[str, float]) -> float:
+    return round(
+        (
+            _higher_better_score(metrics.get("dividend_yield"), (1.0, 2.0, 3.0, 4.0))
+            + _higher_better_score(metrics.get("equity_ratio"), _EQUITY_RATIO_THRESHOLDS)
+            + _lower_better_score(metrics.get("net_de_ratio"), _NET_DE_RATIO_THRESHOLDS)
         )
+        / 3,
+        2,
+    )
 
-    if axis_id == "moat_strength":
-        op_margin = _metric(metrics, "operating_margin")
-        roe = _metric(metrics, "roe")
-        return _avg(
-            [
-                _higher_better_score(op_margin, [10.0, 15.0, 20.0, 30.0]),
-                _higher_better_score(roe, [8.0, 12.0, 16.0, 20.0]),
-            ]
-        )
 
-    if axis_id == "management_quality":
-        equity_ratio = _metric(metrics, "equity_ratio")
-        de_ratio = _metric(metrics, "net_de_ratio")
-        return _avg(
-            [
-                _higher_better_score(equity_ratio, [30.0, 40.0, 50.0, 65.0]),
-                _lower_better_score(de_ratio, [20.0, 40.0, 70.0, 100.0]),
-            ]
+def _score_competitive_advantage(metrics: dict[str, float]) -> float:
+    return round(
+        (
+            _higher_better_score(metrics.get("roe"), _ROE_THRESHOLDS)
+            + _higher_better_score(metrics.get("op_income_cagr_3y"), _OP_INCOME_CAGR_THRESHOLDS)
         )
+        / 2,
+        2,
+    )
 
-    if axis_id == "financial_durability":
-        equity_ratio = _metric(metrics, "equity_ratio")
-        de_ratio = _metric(metrics, "net_de_ratio")
-        op_margin = _metric(metrics, "operating_margin")
-        return _avg(
-            [
-                _higher_better_score(equity_ratio, [30.0, 40.0, 50.0, 70.0]),
-                _lower_better_score(de_ratio, [20.0, 40.0, 70.0, 100.0]),
-                _higher_better_score(op_margin, [5.0, 10.0, 15.0, 20.0]),
-            ]
-        )
 
-    if axis_id == "valuation_reasonableness":
-        per = _metric(metrics, "per")
-        growth_now = _metric(metrics, "revenue_growth_forecast")
-        peg_like = _peg_like(per, growth_now)
-        return _avg(
-            [
-                _lower_better_score(peg_like, [0.8, 1.2, 1.8, 2.5]),
-                _lower_better_score(per, [15.0, 25.0, 35.0, 50.0]),
-            ]
+def _score_risk_resilience(metrics: dict[str, float]) -> float:
+    return round(
+        (
+            _higher_better_score(metrics.get("equity_ratio"), _EQUITY_RATIO_THRESHOLDS)
+            + _lower_better_score(metrics.get("net_de_ratio"), _NET_DE_RATIO_THRESHOLDS)
         )
-
-    return 2.5
-
-
-def _higher_better_score(value: float | None, thresholds: list[float]) -> float:
-    if not isinstance(value, (int, float)):
-        return 2.5
-    points = 1.0
-    for threshold in thresholds:
-        if float(value) >= threshold:
-            points += 1.0
-    return min(points, 5.0)
-
-
-def _lower_better_score(value: float | None, thresholds: list[float]) -> float:
-    if not isinstance(value, (int, float)):
+        / 2,
+        2,
+    )
+
+
+def _score_revenue_growth_strength(metrics: dict[str, float]) -> float:
+    growth_now = metrics.get("revenue_growth_forecast")
+    growth_3y = metrics.get("revenue_cagr_3y")
+    profit_growth = metrics.get("op_income_growth_forecast")
+    return round(
+        (
+            _higher_better_score(growth_now, (5.0, 10.0, 15.0, 25.0))
+            + _higher_better_score(growth_3y, (5.0, 10.0, 15.0, 20.0))
+            + _higher_better_score(profit_growth, (5.0, 10.0, 20.0, 30.0))
+        )
+        / 3,
+        2,
+    )
+
+
+def _score_tam_expansion_potential(metrics: dict[str, float]) -> float:
+    growth_now = metrics.get("revenue_growth_forecast")
+    growth_3y = metrics.get("revenue_cagr_3y")
+    market_cap = metrics.get("market_cap_jpy")
+    return round(
+        (
+            _higher_better_score(growth_now, (10.0, 15.0, 20.0, 30.0))
+            + _higher_better_score(growth_3y, (8.0, 12.0, 16.0, 22.0))
+            + _tam_runway_score(market_cap)
+        )
+        / 3,
+        2,
+    )
+
+
+def _score_profit_structure_improvement(metrics: dict[str, float]) -> float:
+    op_margin = metrics.get("operating_margin")
+    profit_growth = metrics.get("op_income_growth_forecast")
+    return round(
+        (
+            _higher_better_score(op_margin, (8.0, 12.0, 18.0, 25.0))
+            + _higher_better_score(profit_growth, (0.0, 10.0, 20.0, 35.0))
+        )
+        / 2,
+        2,
+    )
+
+
+def _score_moat_strength(metrics: dict[str, float]) -> float:
+    op_margin = metrics.get("operating_margin")
+    roe = metrics.get("roe")
+    return round(
+        (
+            _higher_better_score(op_margin, (10.0, 15.0, 20.0, 30.0))
+            + _higher_better_score(roe, (8.0, 12.0, 16.0, 20.0))
+        )
+        / 2,
+        2,
+    )
+
+
+def _score_management_quality(metrics: dict[str, float]) -> float:
+    equity_ratio = metrics.get("equity_ratio")
+    de_ratio = metrics.get("net_de_ratio")
+    return round(
+        (
+            _higher_better_score(equity_ratio, (30.0, 40.0, 50.0, 65.0))
+            + _lower_better_score(de_ratio, _DE_RATIO_THRESHOLDS)
+        )
+        / 2,
+        2,
+    )
+
+
+def _score_financial_durability(metrics: dict[str, float]) -> float:
+    equity_ratio = metrics.get("equity_ratio")
+    de_ratio = metrics.get("net_de_ratio")
+    op_margin = metrics.get("operating_margin")
+    return round(
+        (
+            _higher_better_score(equity_ratio, (30.0, 40.0, 50.0, 70.0))
+            + _lower_better_score(de_ratio, _DE_RATIO_THRESHOLDS)
+            + _higher_better_score(op_margin, (5.0, 10.0, 15.0, 20.0))
+        )
+        / 3,
+        2,
+    )
+
+
+def _score_valuation_reasonableness(metrics: dict[str, float]) -> float:
+    per = metrics.get("per")
+    growth_now = metrics.get("revenue_growth_forecast")
+    peg_like = _peg_like(per, growth_now)
+    return round(
+        (
+            _lower_better_score(peg_like, (0.8, 1.2, 1.8, 2.5))
+            + _lower_better_score(per, (15.0, 25.0, 35.0, 50.0))
+        )
+        / 2,
+        2,
+    )
+
+
+_AXIS_SCORERS: dict[str, Callable[[dict[str, float]], float]] = {
+    "temporary_lag_factor": _score_temporary_lag_factor,
+    "growth_driver_confidence": _score_growth_driver_confidence,
+    "management_and_capital_policy": _score_management_and_capital_policy,
+    "competitive_advantage": _score_competitive_advantage,
+    "risk_resilience": _score_risk_resilience,
+    "revenue_growth_strength": _score_revenue_growth_strength,
+    "tam_expansion_potential": _score_tam_expansion_potential,
+    "profit_structure_improvement": _score_profit_structure_improvement,
+    "moat_strength": _score_moat_strength,
+    "management_quality": _score_management_quality,
+    "financial_durability": _score_financial_durability,
+    "valuation_reasonableness": _score_valuation_reasonableness,
+}
+
+
+def _higher_better_score(value: float | None, thresholds: tuple[float, ...]) -> float:
+    if value is None:
         return 2.5
-    numeric = float(value)
-    if numeric <= thresholds[0]:
-        return 5.0
-    if numeric <= thresholds[1]:
-        return 4.0
-    if numeric <= thresholds[2]:
-        return 3.0
-    if numeric <= thresholds[3]:
-        return 2.0
-    return 1.0
+    if value != value:
+        # NaN clears no threshold; bisect would place it past all of them.
+        return 1.0
+    # Thresholds are ascending, so the number cleared is the bisect insertion point.
+    return min(1.0 + bisect_right(thresholds, value), 5.0)
 
 
-def _avg(values: list[float]) -> float:
-    if not values:
+def _lower_better_score(value: float | None, thresholds: tuple[float, ...]) -> float:
+    if value is None:
         return 2.5
-    return round(sum(values) / len(values), 2)
-
-
-def _metric(metrics: dict[str, float], key: str) -> float | None:
-    value = metrics.get(key)
-    if not isinstance(value, (int, float)):
-        return None
-    return float(value)
+    if value != value:
+        return 1.0
+    return 5.0 - bisect_left(thresholds, value)
 
 
 def _to_100(total: float, maximum: float) -> float:
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from operator import itemgetter
+
 from ai_investor.models import Candidate
 
 
@@ -15,32 +18,38 @@ def score_candidates(candidates: list[Candidate], metrics: list[dict[str, str]])
     if not candidates or not metrics:
         return
 
-    price_metric_defs = [m for m in metrics if m.get("id") in PRICE_NOW_METRICS]
-    fundamentals_metric_defs = [m for m in metrics if m.get("id") not in PRICE_NOW_METRICS]
+    metrics_key = tuple((m.get("id"), m.get("better", "higher") == "higher") for m in metrics)
+    price_metric_defs, fundamentals_metric_defs = _partition_metrics(metrics_key)
 
-    price_scores_by_metric = _score_by_metrics(candidates, price_metric_defs)
-    fundamentals_scores_by_metric = _score_by_metrics(candidates, fundamentals_metric_defs)
+    price_scores_by_ticker = _score_by_metrics(candidates, price_metric_defs)
+    fundamentals_scores_by_ticker = _score_by_metrics(candidates, fundamentals_metric_defs)
 
     for candidate in candidates:
-        price_values = [score_map[candidate.ticker] for score_map in price_scores_by_metric if candidate.ticker in score_map]
-        fundamentals_values = [
-            score_map[candidate.ticker] for score_map in fundamentals_scores_by_metric if candidate.ticker in score_map
-        ]
-
-        candidate.quantitative_score_price_now = _avg(price_values)
-        candidate.quantitative_score_fundamentals_base = _avg(fundamentals_values)
+        candidate.quantitative_score_price_now = _avg(price_scores_by_ticker.get(candidate.ticker, []))
+        candidate.quantitative_score_fundamentals_base = _avg(fundamentals_scores_by_ticker.get(candidate.ticker, []))
 
         track_scores = [s for s in [candidate.quantitative_score_price_now, candidate.quantitative_score_fundamentals_base] if s > 0]
         candidate.quantitative_score = _avg(track_scores)
 
 
-def _score_by_metrics(candidates: list[Candidate], metric_defs: list[dict[str, str]]) -> list[dict[str, float]]:
-    scored_metrics: list[dict[str, float]] = []
-    for metric_def in metric_defs:
-        metric_id = metric_def.get("id")
-        if not metric_id:
-            continue
-        better = metric_def.get("better", "higher")
+@lru_cache(maxsize=4)
+def _partition_metrics(
+    metrics_key: tuple[tuple[str | None, bool], ...],
+) -> tuple[tuple[tuple[str, bool], ...], tuple[tuple[str, bool], ...]]:
+    """Split (metric id, higher is better) pairs into the price_now and fundamentals_base tracks."""
+    price_defs = tuple((metric_id, higher) for metric_id, higher in metrics_key if metric_id in PRICE_NOW_METRICS)
+    fundamentals_defs = tuple(
+        (metric_id, higher) for metric_id, higher in metrics_key if metric_id and metric_id not in PRICE_NOW_METRICS
+    )
+    return price_defs, fundamentals_defs
+
+
+def _score_by_metrics(
+    candidates: list[Candidate],
+    metric_defs: tuple[tuple[str, bool], ...],
+) -> dict[str, list[float]]:
+    scores_by_ticker: dict[str, list[float]] = {}
+    for metric_id, higher_is_better in metric_defs:
         metric_values = []
         for candidate in candidates:
             value = candidate.quantitative_metrics.get(metric_id)
@@ -48,21 +57,19 @@ def _score_by_metrics(candidates: list[Candidate], metric_defs: list[dict[str, s
                 metric_values.append((candidate.ticker, float(value)))
         if not metric_values:
             continue
-        scored_metrics.append(_rank_score(metric_values, higher_is_better=(better == "higher")))
-    return scored_metrics
+        for ticker, score in _rank_score(metric_values, higher_is_better=higher_is_better).items():
+            scores_by_ticker.setdefault(ticker, []).append(score)
+    return scores_by_ticker
 
 
 def _rank_score(metric_values: list[tuple[str, float]], higher_is_better: bool) -> dict[str, float]:
-    sorted_values = sorted(metric_values, key=lambda item: item[1], reverse=higher_is_better)
+    sorted_values = sorted(metric_values, key=itemgetter(1), reverse=higher_is_better)
     n = len(sorted_values)
     if n == 1:
         return {sorted_values[0][0]: 100.0}
 
-    scores: dict[str, float] = {}
-    for idx, (ticker, _) in enumerate(sorted_values):
-        percentile = 1.0 - (idx / (n - 1))
-        scores[ticker] = percentile * 100.0
-    return scores
+    last = n - 1
+    return {ticker: (1.0 - idx / last) * 100.0 for idx, (ticker, _) in enumerate(sorted_values)}
 
 
 def _avg(values: list[float]) -> float: